@@ -3,9 +3,105 @@
 author: Aaron Gobeyn
 """
 
+from functools import lru_cache
+
 from ..utils import wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
+__all__ = ["ASCIIExport"]
+
+# Supported options for the data mode and file type.
+_DATA_MODE = frozenset({"FixedNumber", "FixedWidth"})
+_FILE_TYPE = frozenset({"ascii", "csv", "hdf5"})
+# Templates for the lines that take several values.
+_ASCII_TMPL_STEP = ".StepX {}\n.StepY {}\n.StepZ {}\n"
+_ASCII_TMPL_SUBVOLUME = ".SetSubvolume {}\n"
+
+
+@lru_cache(maxsize=64)
+def _ascii_template(
+    has_data_mode: bool,
+    has_step: bool,
+    has_step_directional: bool,
+    has_subvolume: bool,
+    has_csv_separator: bool,
+) -> str:
+    """Build the format string of the `ASCIIExport` block for the given combination of optional
+    arguments. Only the lines of the arguments that are set are included, so the result can be
+    formatted with the values of the set arguments in order. The result is cached, such that the
+    template for a given combination is only assembled once.
+
+    :param has_data_mode: Include the `.Mode` line.
+    :type has_data_mode: bool
+    :param has_step: Include the `.Step` line.
+    :type has_step: bool
+    :param has_step_directional: Include the `.StepX`, `.StepY` and `.StepZ` lines.
+    :type has_step_directional: bool
+    :param has_subvolume: Include the `.SetSubvolume` line.
+    :type has_subvolume: bool
+    :param has_csv_separator: Include the `.SetCsvSeparator` line.
+    :type has_csv_separator: bool
+    """
+    lines: list[str] = [".Reset\n", ".FileName {}\n", ".SetfileType {}\n"]
+    if has_data_mode:
+        lines.append(".Mode {}\n")
+    if has_step:
+        lines.append(".Step {}\n")
+    if has_step_directional:
+        lines.append(_ASCII_TMPL_STEP)
+    if has_subvolume:
+        lines.append(_ASCII_TMPL_SUBVOLUME)
+    lines.append(".UseSubvolume {}\n")
+    lines.append(".ExportCoordinatesInMeter {}\n")
+    if has_csv_separator:
+        lines.append(".SetCsvSeparator {}\n")
+    lines.append(".Execute\n")
+    return "".join(lines)
+
+
+def _build_ascii_export(
+    export_path: str,
+    data_mode: str | None,
+    file_type: str,
+    step: int | float | None,
+    step_directional: list[int] | list[float] | None,
+    subvolume: list[tuple[float, float]] | None,
+    use_subvolume: bool,
+    use_meter: bool,
+    csv_separator: str | None,
+) -> str:
+    """Build the contents of the `With ASCIIExport` block, see `ASCIIExport`."""
+    q = wrap_nonstr_in_double_quotes
+    # Collect the values in the order in which they appear in the template.
+    values: list[str] = [
+        VbaWriter.string_repr(export_path),
+        VbaWriter.string_repr(file_type),
+    ]
+    if data_mode is not None:
+        values.append(VbaWriter.string_repr(data_mode))
+    if step is not None:
+        values.append(q(step))
+    if step_directional is not None:
+        values.extend(
+            (q(step_directional[0]), q(step_directional[1]), q(step_directional[2]))
+        )
+    if subvolume is not None:
+        (x_min, x_max), (y_min, y_max), (z_min, z_max) = subvolume
+        values.append(", ".join(map(q, (x_min, x_max, y_min, y_max, z_min, z_max))))
+    values.append(q(use_subvolume))
+    values.append(q(use_meter))
+    if csv_separator is not None:
+        values.append(VbaWriter.string_repr(csv_separator))
+
+    template: str = _ascii_template(
+        has_data_mode=data_mode is not None,
+        has_step=step is not None,
+        has_step_directional=step_directional is not None,
+        has_subvolume=subvolume is not None,
+        has_csv_separator=csv_separator is not None,
+    )
+    return template.format(*values)
+
 
 # NOTE: We have not implemented all the available options yet!
 def ASCIIExport(
@@ -55,44 +151,24 @@ def ASCIIExport(
     :param csv_separator: Separator for csv file formats, this is only available for 2D/3D exports.
     :type csv_separator: str (default=",")
     """
-    if data_mode is not None:
-        assert data_mode in [
-            "FixedNumber",
-            "FixedWidth",
-        ], "Provided data mode is not of the supported options."
-    assert file_type in [
-        "ascii",
-        "csv",
-        "hdf5",
-    ], "Provided file type is not of the supported options."
+    assert (
+        data_mode is None or data_mode in _DATA_MODE
+    ), "Provided data mode is not of the supported options."
+    assert (
+        file_type in _FILE_TYPE
+    ), "Provided file type is not of the supported options."
 
-    writer.start_with(structure="ASCIIExport")
-    writer.write(".Reset\n")
-    writer.write(f".FileName {VbaWriter.string_repr(text=export_path)}\n")
-    writer.write(f".SetfileType {VbaWriter.string_repr(text=file_type)}\n")
-    if data_mode is not None:
-        writer.write(f".Mode {VbaWriter.string_repr(text=data_mode)}\n")
-    if step is not None:
-        writer.write(f".Step {wrap_nonstr_in_double_quotes(value=step)}\n")
-    if step_directional is not None:
-        writer.write(
-            f".StepX {wrap_nonstr_in_double_quotes(value=step_directional[0])}\n"
-        )
-        writer.write(
-            f".StepY {wrap_nonstr_in_double_quotes(value=step_directional[1])}\n"
-        )
-        writer.write(
-            f".StepZ {wrap_nonstr_in_double_quotes(value=step_directional[2])}\n"
-        )
-    if subvolume is not None:
-        writer.write(
-            f".SetSubvolume {wrap_nonstr_in_double_quotes(value=subvolume[0][0])}, {wrap_nonstr_in_double_quotes(value=subvolume[0][1])}, {wrap_nonstr_in_double_quotes(value=subvolume[1][0])}, {wrap_nonstr_in_double_quotes(value=subvolume[1][1])}, {wrap_nonstr_in_double_quotes(value=subvolume[2][0])}, {wrap_nonstr_in_double_quotes(value=subvolume[2][1])}\n"
-        )
-    writer.write(f".UseSubvolume {wrap_nonstr_in_double_quotes(value=use_subvolume)}\n")
-    writer.write(
-        f".ExportCoordinatesInMeter {wrap_nonstr_in_double_quotes(value=use_meter)}\n"
+    writer.write_with(
+        "ASCIIExport",
+        _build_ascii_export(
+            export_path,
+            data_mode,
+            file_type,
+            step,
+            step_directional,
+            subvolume,
+            use_subvolume,
+            use_meter,
+            csv_separator,
+        ),
     )
-    if csv_separator is not None:
-        writer.write(f".SetCsvSeparator {VbaWriter.string_repr(text=csv_separator)}\n")
-    writer.write(".Execute\n")
-    writer.end_with()
@@ -5,6 +5,24 @@ author: Aaron Gobeyn
 
 from ..writer import VbaWriter
 
+# Supported units for each quantity.
+_LENGTH = frozenset({"m", "cm", "mm", "um", "nm", "ft", "in", "mil"})
+_TIME = frozenset({"fs", "ps", "ns", "us", "ms", "s"})
+_FREQUENCY = frozenset({"Hz", "kHz", "MHz", "GHz", "THz", "PHz"})
+_TEMPERATURE = frozenset({"celsius", "kelvin", "fahrenheit"})
+# Template for the contents of the `With` block.
+_UNITS_TMPL = ".Geometry {}\n.Time {}\n.Frequency {}\n.TemperatureUnit {}\n"
+
+
+def _build_units(length: str, time: str, frequency: str, temperature: str) -> str:
+    """Build the contents of the `With Units` block, see `Units`."""
+    return _UNITS_TMPL.format(
+        VbaWriter.string_repr(length),
+        VbaWriter.string_repr(time),
+        VbaWriter.string_repr(frequency),
+        VbaWriter.string_repr(temperature),
+    )
+
 
 def Units(
     writer: VbaWriter,
@@ -53,41 +71,9 @@ def Units(
     :param temperature: Unit of temperature, the options are "celsius", "kelvin" and "fahrenheit".
     :type temperature: str (default="celsius")
     """
-    assert length in [
-        "m",
-        "cm",
-        "mm",
-        "um",
-        "nm",
-        "ft",
-        "in",
-        "mil",
-    ], "Provided unit of length is not supported."
-    assert time in [
-        "fs",
-        "ps",
-        "ns",
-        "us",
-        "ms",
-        "s",
-    ], "Provided unit of time is not supported."
-    assert frequency in [
-        "Hz",
-        "kHz",
-        "MHz",
-        "GHz",
-        "THz",
-        "PHz",
-    ], "Provided unit of frequency is not supported."
-    assert temperature in [
-        "celsius",
-        "kelvin",
-        "fahrenheit",
-    ], "Provided unit of temperature is not supported."
+    assert length in _LENGTH, "Provided unit of length is not supported."
+    assert time in _TIME, "Provided unit of time is not supported."
+    assert frequency in _FREQUENCY, "Provided unit of frequency is not supported."
+    assert temperature in _TEMPERATURE, "Provided unit of temperature is not supported."
 
-    writer.start_with(structure="Units")
-    writer.write(f".Geometry {VbaWriter.string_repr(text=length)}\n")
-    writer.write(f".Time {VbaWriter.string_repr(text=time)}\n")
-    writer.write(f".Frequency {VbaWriter.string_repr(text=frequency)}\n")
-    writer.write(f".TemperatureUnit {VbaWriter.string_repr(text=temperature)}\n")
-    writer.end_with()
+    writer.write_with("Units", _build_units(length, time, frequency, temperature))
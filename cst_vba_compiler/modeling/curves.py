@@ -3,299 +3,506 @@
 author: Aaron Gobeyn
 """
 
+from collections.abc import Callable
+from itertools import repeat
+from typing import NamedTuple
+
 from ..utils import num_or_list_of_nums_to_str, wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
+# Templates for the contents of the `With` blocks.
+_ELLIPSE_TMPL = (
+    ".Reset\n"
+    ".Name {}\n"
+    ".Curve {}\n"
+    ".XRadius {}\n"
+    ".YRadius {}\n"
+    ".Xcenter {}\n"
+    ".Ycenter {}\n"
+    ".Segments {}\n"
+    ".Create\n"
+)
+_LINE_TMPL = (
+    ".Reset\n"
+    ".Name {}\n"
+    ".Curve {}\n"
+    ".X1 {}\n"
+    ".Y1 {}\n"
+    ".X2 {}\n"
+    ".Y2 {}\n"
+    ".Create\n"
+)
+_TRIM_CURVES_TMPL = (
+    ".Reset\n"
+    ".Curve {}\n"
+    ".CurveItem1 {}\n"
+    ".CurveItem2 {}\n"
+    ".DeleteEdges1 {}\n"
+    ".DeleteEdges2 {}\n"
+    ".Trim\n"
+)
+# Templates for the lines of a Polygon, the head contains the starting point.
+_POLYGON_TMPL_HEAD = ".Reset\n" ".Name {}\n" ".Curve {}\n" ".Point {}, {}\n"
+_POLYGON_TMPL_RLINE = ".RLine {}, {}\n"
+_POLYGON_TMPL_LINETO = ".LineTo {}, {}\n"
 
-class Curves:
-    @staticmethod
-    def Ellipse(
-        writer: VbaWriter,
-        name: str,
-        center: tuple[float | str, float | str],
-        x_radius: float | str,
-        y_radius: float | str,
-        segments: int = 0,
-        curve: str = "curve",
-    ):
-        """Create 2D ellipse in the xy-plane centered on `center` with radius `x_radius` in the $x$-direction and
-        radius `y_radius` in the $y$-direction. If the value of `segments` is $0$, the ellipse is a perfect, unsegmented ellipse.
-        Otherwise, the values should be greater than $2$ and the ellipse is represented by a segmented polygonal curve.
-
-        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/3D/common_struct/common_struct_curveellipse.htm
-
-        :param writer: VBA IO handler
-        :type writer: VbaWriter
-        :param name: Name of the Ellipse
-        :type name: str
-        :param center: $(x,y)$ coordinates of the Ellipse center. The values can either be literal (`float`) or
-            the name of a parameter (`str`).
-        :type center: tuple[float | str, float | str]
-        :param x_radius: Ellipse radius in the $x$-direction. The value can either be literal (`float`) or the name
-            of a parameter (`str`).
-        :type x_radius: float | str
-        :param y_radius: Ellipse radius in the $y$-direction. The value van either be literal (`float`) or the name of
-            a parameter (`str`).
-        :type y_radius: float | str
-        :param segments: Amount of segments the Ellipse should be split into. If $0$, the ellipse is unsegmented (perfect),
-            otherwise the value should be larger than $2$ and the Ellipse is represented by a segmented polygonal curve.
-        :type segments: int (default=0)
-        :param curve: Name of the folder under Curves where the Ellipse is stored.
-        :type curve: str (default="curve")
-        """
-
-        # Start the `With` block
-        writer.start_with(structure="Ellipse")
-        # Default line that always appears for some reason
-        writer.write(text=".Reset\n")
-        # Set the name of the ellipse
-        writer.write(text=f".Name {VbaWriter.string_repr(text=name)}\n")
-        # Set the name of the curve
-        writer.write(text=f".Curve {VbaWriter.string_repr(text=curve)}\n")
-        # Set the x-radius
-        writer.write(text=f".XRadius {wrap_nonstr_in_double_quotes(value=x_radius)}\n")
-        # Set the y-radius
-        writer.write(text=f".YRadius {wrap_nonstr_in_double_quotes(value=y_radius)}\n")
-        # Set the x-coordinate of the center
-        writer.write(text=f".Xcenter {wrap_nonstr_in_double_quotes(center[0])}\n")
-        # Set the y-coordinate of the center
-        writer.write(text=f".Ycenter {wrap_nonstr_in_double_quotes(center[1])}\n")
-        # Set the segments
-        writer.write(text=f".Segments {wrap_nonstr_in_double_quotes(segments)}\n")
-        # Create the curve
-        writer.write(text=".Create\n")
-        # End the `With` block
-        writer.end_with()
-
-    @staticmethod
-    def Line(
-        writer: VbaWriter,
+
+class PolygonSpec(NamedTuple):
+    """Description of a single polygon for `Polygons`, the fields have the same
+    meaning as the arguments of `Polygon`."""
+
+    name: str
+    start_point: tuple[float | str, float | str]
+    next_points: list[tuple[float | str, float | str]]
+    which_relative: list[bool] | None = None
+
+
+def _build_ellipse(
+    name: str,
+    center: tuple[float | str, float | str],
+    x_radius: float | str,
+    y_radius: float | str,
+    segments: int,
+    curve: str,
+) -> str:
+    """Build the contents of the `With Ellipse` block, see `Ellipse`."""
+    q = wrap_nonstr_in_double_quotes
+    center_x, center_y = center
+    return _ELLIPSE_TMPL.format(
+        VbaWriter.string_repr(name),
+        VbaWriter.string_repr(curve),
+        q(x_radius),
+        q(y_radius),
+        q(center_x),
+        q(center_y),
+        q(segments),
+    )
+
+
+def _build_line(
+    name: str,
+    start_point: tuple[float | str, float | str],
+    end_point: tuple[float | str, float | str],
+    curve_repr: str,
+) -> str:
+    """Build the contents of the `With Line` block, see `Line`. The `curve_repr` is
+    the VBA string of the curve, such that batches only have to convert it once."""
+    q = wrap_nonstr_in_double_quotes
+    start_x, start_y = start_point
+    end_x, end_y = end_point
+    return _LINE_TMPL.format(
+        VbaWriter.string_repr(name),
+        curve_repr,
+        q(start_x),
+        q(start_y),
+        q(end_x),
+        q(end_y),
+    )
+
+
+def _build_polygon(
+    name: str,
+    start_point: tuple[float | str, float | str],
+    next_points: list[tuple[float | str, float | str]],
+    which_relative: list[bool] | None,
+    curve_repr: str,
+) -> str:
+    """Build the contents of the `With Polygon` block, see `Polygon`. The `curve_repr` is
+    the VBA string of the curve, such that batches only have to convert it once."""
+    # Check that at least one connecting point is given
+    assert (
+        len(next_points) >= 1
+    ), "At least one connecting point is needed to define a Polygon Curve."
+    # Check that every connecting point has an interpretation
+    assert which_relative is None or len(next_points) == len(
+        which_relative
+    ), "Length of `next_points` array is not equal to the length of `which_relative` array."
+
+    q = wrap_nonstr_in_double_quotes
+    start_x, start_y = start_point
+    parts: list[str] = [
+        _POLYGON_TMPL_HEAD.format(
+            VbaWriter.string_repr(name),
+            curve_repr,
+            q(start_x),
+            q(start_y),
+        )
+    ]
+    # Write connecting point lines, bind the methods used in the loop to locals
+    append = parts.append
+    rline = _POLYGON_TMPL_RLINE.format
+    lineto = _POLYGON_TMPL_LINETO.format
+    # If `which_relative` is `None`, every point is absolute
+    relative_iter = repeat(False) if which_relative is None else which_relative
+    for (x, y), is_relative in zip(next_points, relative_iter):
+        if is_relative:
+            append(rline(q(x), q(y)))
+        else:
+            append(lineto(q(x), q(y)))
+    # Create Polygon
+    append(".Create\n")
+    return "".join(parts)
+
+
+def _build_trim_curves(
+    curve_item_1: str,
+    curve_item_2: str,
+    delete_edges_1: int | list[int] | None,
+    delete_edges_2: int | list[int] | None,
+    curve: str,
+) -> str:
+    """Build the contents of the `With TrimCurves` block, see `TrimCurves`."""
+    # No edges are deleted if the edges are `None`, a single edge is quoted in place
+    if delete_edges_1 is None:
+        edges_1: str = '""'
+    elif isinstance(delete_edges_1, int):
+        edges_1: str = f'"{delete_edges_1}"'
+    else:
+        edges_1: str = num_or_list_of_nums_to_str(delete_edges_1)
+    if delete_edges_2 is None:
+        edges_2: str = '""'
+    elif isinstance(delete_edges_2, int):
+        edges_2: str = f'"{delete_edges_2}"'
+    else:
+        edges_2: str = num_or_list_of_nums_to_str(delete_edges_2)
+    return _TRIM_CURVES_TMPL.format(
+        VbaWriter.string_repr(curve),
+        VbaWriter.string_repr(curve_item_1),
+        VbaWriter.string_repr(curve_item_2),
+        edges_1,
+        edges_2,
+    )
+
+
+def Ellipse(
+    writer: VbaWriter,
+    name: str,
+    center: tuple[float | str, float | str],
+    x_radius: float | str,
+    y_radius: float | str,
+    segments: int = 0,
+    curve: str = "curve",
+):
+    """Create 2D ellipse in the xy-plane centered on `center` with radius `x_radius` in the $x$-direction and
+    radius `y_radius` in the $y$-direction. If the value of `segments` is $0$, the ellipse is a perfect, unsegmented ellipse.
+    Otherwise, the values should be greater than $2$ and the ellipse is represented by a segmented polygonal curve.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/3D/common_struct/common_struct_curveellipse.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param name: Name of the Ellipse
+    :type name: str
+    :param center: $(x,y)$ coordinates of the Ellipse center. The values can either be literal (`float`) or
+        the name of a parameter (`str`).
+    :type center: tuple[float | str, float | str]
+    :param x_radius: Ellipse radius in the $x$-direction. The value can either be literal (`float`) or the name
+        of a parameter (`str`).
+    :type x_radius: float | str
+    :param y_radius: Ellipse radius in the $y$-direction. The value van either be literal (`float`) or the name of
+        a parameter (`str`).
+    :type y_radius: float | str
+    :param segments: Amount of segments the Ellipse should be split into. If $0$, the ellipse is unsegmented (perfect),
+        otherwise the value should be larger than $2$ and the Ellipse is represented by a segmented polygonal curve.
+    :type segments: int (default=0)
+    :param curve: Name of the folder under Curves where the Ellipse is stored.
+    :type curve: str (default="curve")
+    """
+
+    writer.write_with(
+        "Ellipse", _build_ellipse(name, center, x_radius, y_radius, segments, curve)
+    )
+
+
+def Line(
+    writer: VbaWriter,
+    name: str,
+    start_point: tuple[float | str, float | str],
+    end_point: tuple[float | str, float | str],
+    curve: str = "curve",
+) -> None:
+    """Create a 2D line in the xy-plane called `name` in the Curves folder under the name `curve`
+    starting from `start_point` and ending at `end_point`.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/3D/common_struct/common_struct_curveline.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param name: Name of the created Line
+    :type name: str
+    :param start_point: Tuple of numeric values (`float`) and/or parameter names (`str`) containing the $(x,y)$ values at which the Line
+        starts.
+    :type start_point: tuple[float | str, float | str]
+    :param end_point: Tuple of numeric values (`float`) and/or parameter names (`str`) containing the $(x,y)$ values at which the Line ends.
+    :type end_point: tuple[float | str, float | str]
+    :param curve: Name of the folder under Curves where the Line is stored.
+    :type curve: str (default="curve")
+    """
+    writer.write_with(
+        "Line",
+        _build_line(name, start_point, end_point, VbaWriter.string_repr(curve)),
+    )
+
+
+def Polygon(
+    writer: VbaWriter,
+    name: str,
+    start_point: tuple[float | str, float | str],
+    next_points: list[tuple[float | str, float | str]],
+    which_relative: list[bool] | None = None,
+    curve: str = "curve",
+) -> None:
+    """
+    Create a 2D polygon curve, the curve starts at `start_point` and connects the `next_points` in lines, e.g.
+    `start_point` is connected to `next_points[0]`, which is connection to `next_points[1]` etc. By default, each
+    point in the `next_points` list is assumed to be an absolute point. It is also possible to interpret a point in
+    `next_points` as relative to the previous point. A point will be interpreted as relative, if the index for said point
+    in the `which_relative` list is set to `True`, e.g. if point `next_points[i]` needs to be interpreted as relative,
+    `which_relative[i]` should be `True`, otherwise it should be `False`.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_polygon_object.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param name: Name of the created line
+    :type name: str
+    :param start_point: Starting $(x,y)$ point of the polygonal curve, specified as a tuple of numeric values (`float`) and/or
+        parameter names (`str`).
+    :type start_point: tuple[float | str, float | str]
+    :param next_points: List of points in the same format as `start_point` that connect, in sequence, to form the polygonal curve.
+    :type next_points: list[tuple[float | str, float | str]]
+    :param which_relative: List of boolean values specifying which points should be interpreted as relative to the previous point (`True`) and
+        which as absolute points (`False`). If set the `None` (the default value), it is equivalent to having a list of `False` values. Note that
+        the length of the list should be of equal length as the `next_points` list.
+    :type which_relative: list[bool] | None (default=None)
+    :param curve: Name of the folder under Curves where the Polygon is stored.
+    :type curve: str (default="curve")
+    """
+    writer.write_with(
+        "Polygon",
+        _build_polygon(
+            name,
+            start_point,
+            next_points,
+            which_relative,
+            VbaWriter.string_repr(curve),
+        ),
+    )
+
+
+def Polygons(
+    writer: VbaWriter,
+    polygons: list[PolygonSpec],
+    curve: str = "curve",
+) -> None:
+    """Create a 2D polygon in the Curves folder `curve` for every `PolygonSpec` in `polygons`. The
+    points of each spec are interpreted as in `Polygon`, the polygons follow each other in one `With Polygon` block.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_polygon_object.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param polygons: Polygons to create, each entry holds the `name`, `start_point`, `next_points` and
+        `which_relative` arguments of `Polygon`.
+    :type polygons: list[PolygonSpec]
+    :param curve: Name of the folder under Curves where the Polygons are stored.
+    :type curve: str (default="curve")
+    """
+    if not polygons:
+        return
+    curve_repr: str = VbaWriter.string_repr(curve)
+    writer.write_with(
+        "Polygon",
+        "".join(
+            [
+                _build_polygon(
+                    polygon.name,
+                    polygon.start_point,
+                    polygon.next_points,
+                    polygon.which_relative,
+                    curve_repr,
+                )
+                for polygon in polygons
+            ]
+        ),
+    )
+
+
+def LineBatch(
+    writer: VbaWriter,
+    lines: list[
+        tuple[str, tuple[float | str, float | str], tuple[float | str, float | str]]
+    ],
+    curve: str = "curve",
+) -> None:
+    """Create a 2D line in the xy-plane in the Curves folder `curve` for every `(name, start_point, end_point)`
+    tuple in `lines`, the lines follow each other in one `With Line` block.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/3D/common_struct/common_struct_curveline.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param lines: Lines to create, each entry is a tuple of the `name`, `start_point` and `end_point`
+        arguments of `Line`.
+    :type lines: list[tuple[str, tuple[float | str, float | str], tuple[float | str, float | str]]]
+    :param curve: Name of the folder under Curves where the Lines are stored.
+    :type curve: str (default="curve")
+    """
+    if not lines:
+        return
+    curve_repr: str = VbaWriter.string_repr(curve)
+    writer.write_with(
+        "Line",
+        "".join(
+            [
+                _build_line(name, start_point, end_point, curve_repr)
+                for name, start_point, end_point in lines
+            ]
+        ),
+    )
+
+
+def line_emitter(
+    writer: VbaWriter, curve: str = "curve"
+) -> Callable[
+    [str, tuple[float | str, float | str], tuple[float | str, float | str]], None
+]:
+    """Return a function that creates a 2D line under `curve`, called with the `name`, `start_point`
+    and `end_point` arguments of `Line`. The `.Curve` line is formatted into the template once, which
+    saves work when a lot of lines are created in the same curve.
+
+    Example:
+        emit = Curves.line_emitter(writer, curve="mycurve")
+        for i in range(1000):
+            emit(f"line{i}", (0.0, i), (1.0, i))
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param curve: Name of the folder under Curves where the Lines are stored.
+    :type curve: str (default="curve")
+    """
+    # Braces in the curve name must survive the second `format` call.
+    curve_repr: str = VbaWriter.string_repr(curve).replace("{", "{{").replace("}", "}}")
+    template: str = _LINE_TMPL.format("{}", curve_repr, "{}", "{}", "{}", "{}")
+    q = wrap_nonstr_in_double_quotes
+    s = VbaWriter.string_repr
+    write_with = writer.write_with
+
+    def emit(
         name: str,
         start_point: tuple[float | str, float | str],
         end_point: tuple[float | str, float | str],
-        curve: str = "curve",
     ) -> None:
-        """Create a 2D line in the xy-plane called `name` in the Curves folder under the name `curve`
-        starting from `start_point` and ending at `end_point`.
-
-        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/3D/common_struct/common_struct_curveline.htm
-
-        :param writer: VBA IO handler
-        :type writer: VbaWriter
-        :param name: Name of the created Line
-        :type name: str
-        :param start_point: Tuple of numeric values (`float`) and/or parameter names (`str`) containing the $(x,y)$ values at which the Line
-            starts.
-        :type start_point: tuple[float | str, float | str]
-        :param end_point: Tuple of numeric values (`float`) and/or parameter names (`str`) containing the $(x,y)$ values at which the Line ends.
-        :type end_point: tuple[float | str, float | str]
-        :param curve: Name of the folder under Curves where the Line is stored.
-        :type curve: str (default="curve")
-        """
-        # Start the `With` block
-        writer.start_with(structure="Line")
-        # Default line that always appears for some reason
-        writer.write(text=".Reset\n")
-        # Set the name of the line
-        writer.write(text=f".Name {VbaWriter.string_repr(text=name)}\n")
-        # Set the name of the curve
-        writer.write(text=f".Curve {VbaWriter.string_repr(text=curve)}\n")
-        # Set x-coordinate of first point
-        writer.write(text=f".X1 {wrap_nonstr_in_double_quotes(value=start_point[0])}\n")
-        # Set y-coordinate of first point
-        writer.write(text=f".Y1 {wrap_nonstr_in_double_quotes(value=start_point[1])}\n")
-        # Set x-coordinate of second point
-        writer.write(text=f".X2 {wrap_nonstr_in_double_quotes(value=end_point[0])}\n")
-        # Set y-coordinate of second point
-        writer.write(text=f".Y2 {wrap_nonstr_in_double_quotes(value=end_point[1])}\n")
-        # Create the line
-        writer.write(text=f".Create\n")
-        # End the `With` block
-        writer.end_with()
-
-    @staticmethod
-    def Polygon(
-        writer: VbaWriter,
-        name: str,
-        start_point: tuple[float | str, float | str],
-        next_points: list[tuple[float | str, float | str]],
-        which_relative: list[bool] | None = None,
-        curve: str = "curve",
-    ) -> None:
-        """
-        Create a 2D polygon curve, the curve starts at `start_point` and connects the `next_points` in lines, e.g.
-        `start_point` is connected to `next_points[0]`, which is connection to `next_points[1]` etc. By default, each
-        point in the `next_points` list is assumed to be an absolute point. It is also possible to interpret a point in
-        `next_points` as relative to the previous point. A point will be interpreted as relative, if the index for said point
-        in the `which_relative` list is set to `True`, e.g. if point `next_points[i]` needs to be interpreted as relative,
-        `which_relative[i]` should be `True`, otherwise it should be `False`.
-
-        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_polygon_object.htm
-
-        :param writer: VBA IO handler
-        :type writer: VbaWriter
-        :param name: Name of the created line
-        :type name: str
-        :param start_point: Starting $(x,y)$ point of the polygonal curve, specified as a tuple of numeric values (`float`) and/or
-            parameter names (`str`).
-        :type start_point: tuple[float | str, float | str]
-        :param next_points: List of points in the same format as `start_point` that connect, in sequence, to form the polygonal curve.
-        :type next_points: list[tuple[float | str, float | str]]
-        :param which_relative: List of boolean values specifying which points should be interpreted as relative to the previous point (`True`) and
-            which as absolute points (`False`). If set the `None` (the default value), it is equivalent to having a list of `False` values. Note that
-            the length of the list should be of equal length as the `next_points` list.
-        :type which_relative: list[bool] | None (default=None)
-        :param curve: Name of the folder under Curves where the Polygon is stored.
-        :type curve: str (default="curve")
-        """
-        # Check that at least one connecting point is given
-        assert (
-            len(next_points) >= 1
-        ), "At least one connecting point is needed to define a Polygon Curve."
-        # If `which_relative` is `None`, interpret as array of `False` values
-        if which_relative is None:
-            which_relative: list[bool] = [False for _ in range(len(next_points))]
-        else:
-            # Check that every connecting point has an interpretation
-            assert len(next_points) == len(
-                which_relative
-            ), "Length of `next_points` array is not equal to the length of `which_relative` array."
-
-        # Start `With` block
-        writer.start_with(structure="Polygon")
-        # Write reset line
-        writer.write(".Reset\n")
-        # Set name of curve
-        writer.write(f".Name {VbaWriter.string_repr(text=name)}\n")
-        # Set the name of the curve
-        writer.write(text=f".Curve {VbaWriter.string_repr(text=curve)}\n")
-        # Set starting point
-        writer.write(
-            f".Point {wrap_nonstr_in_double_quotes(value=start_point[0])}, {wrap_nonstr_in_double_quotes(value=start_point[1])}\n"
+        start_x, start_y = start_point
+        end_x, end_y = end_point
+        write_with(
+            "Line", template.format(s(name), q(start_x), q(start_y), q(end_x), q(end_y))
         )
-        # Write connecting point lines
-        for point, is_relative in zip(next_points, which_relative):
-            if is_relative:
-                writer.write(
-                    f".RLine {wrap_nonstr_in_double_quotes(value=point[0])}, {wrap_nonstr_in_double_quotes(value=point[1])}\n"
-                )
-            else:
-                writer.write(
-                    f".LineTo {wrap_nonstr_in_double_quotes(value=point[0])}, {wrap_nonstr_in_double_quotes(value=point[1])}\n"
-                )
-        # Create Polygon
-        writer.write(".Create\n")
-        # End `With` block
-        writer.end_with()
-
-    @staticmethod
-    def TrimCurves(
-        writer: VbaWriter,
-        curve_item_1: str,
-        curve_item_2: str,
-        delete_edges_1: int | list[int] | None,
-        delete_edges_2: int | list[int] | None,
-        curve: str = "curve",
-    ) -> None:
-        """
-        Trim two intersecting items under the Curves folder. Points of intersection created new segments/edges which can be deleted (trimmed).
-        Note that the items must be stored in Curves under the same curve object.
-
-        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_trimcurves_object.htm
-
-        :param writer: VBA IO handler
-        :type writer: VbaWriter
-        :param curve_item_1: Name of curve item under Curves/`curve` to intersect with `curve_item_2`.
-        :type curve_item_1: str
-        :param curve_item_2: Name of curve item under Curves/`curve` to intersect with `curve_item_1`.
-        :type curve_item_2: str
-        :param delete_edges_1: Edge, or list of edges, of `curve_item_1` defined due to the curve intersection that
-            will be deleted by the Trim operation. If `None`, no edge from this curve is deleted.
-        :type delete_edges_1: int | list[int] | None
-        :param delete_edges_2: Edge, or list of edges, of `curve_item_1` defined due to the curve intersection that
-            will be deleted by the Trim operation. If `None`, no edge from this curve is deleted.
-        :type delete_edges_2: int | list[int] | None
-        :param curve: Name of the folder under Curves where the Ellipse is stored.
-        :type curve: str (default="curve")
-        """
-        # Start the `With` block
-        writer.start_with(structure="TrimCurves")
-        # Default line that always appears for some reason
-        writer.write(text=".Reset\n")
-        # Set the curve object
-        writer.write(text=f".Curve {VbaWriter.string_repr(text=curve)}\n")
-        # Set the first curve item
-        writer.write(text=f".CurveItem1 {VbaWriter.string_repr(text=curve_item_1)}\n")
-        # Set the second curve item
-        writer.write(text=f".CurveItem2 {VbaWriter.string_repr(text=curve_item_2)}\n")
-        # Set the edges to trim for the first curve
-        if delete_edges_1 is None:
-            writer.write(f'.DeleteEdges1 ""\n')
-        else:
-            writer.write(
-                text=f".DeleteEdges1 {num_or_list_of_nums_to_str(nums=delete_edges_1)}\n"
-            )
-        # Set the edges to trim for the second curve
-        if delete_edges_2 is None:
-            writer.write(f'.DeleteEdges2 ""\n')
-        else:
-            writer.write(
-                text=f".DeleteEdges2 {num_or_list_of_nums_to_str(nums=delete_edges_2)}\n"
-            )
-        # Execute the Trim
-        writer.write(text=".Trim\n")
-        # End the `With` block
-        writer.end_with()
-
-    @staticmethod
-    def NewCurve(writer: VbaWriter, curve: str, name: str | None = None) -> None:
-        """Create a new curve object called `curve` under the `Curve` folder, optionally
-        create a curve called `name` under the `curve` object.
-
-        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_curve_object.htm
-
-        :param writer: VBA IO handler.
-        :type writer: VbaWriter
-        :param curve: Name of the new curve object under the `Curve` folder.
-        :type curve: str
-        :param name: Name of the new curve under the curve object called `curve`. If this
-            parameter `None`, the default value, then only the curve object will be created.
-        :type name: str | None (default=None)
-        """
-        if name is None:
-            writer.write(f"Curve.NewCurve {VbaWriter.string_repr(text=curve)}\n")
-        else:
-            writer.write(
-                f"Curve.NewCurve {VbaWriter.string_repr(text=curve)}, {VbaWriter.string_repr(text=name)}\n"
-            )
-
-    @staticmethod
-    def DeleteCurve(writer: VbaWriter, curve: str) -> None:
-        """Delete the curve object called `curve` stored in the `Curves` folder.
-
-        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_curve_object.htm
-
-        :param writer: VBA IO handler
-        :type writer: VbaWriter
-        :param curve: Name of curve object under `Curve` folder.
-        :type curve: str
-        """
-        writer.write(f"Curve.DeleteCurve {VbaWriter.string_repr(text=curve)}\n")
-
-    @staticmethod
-    def DeleteCurveItem(writer: VbaWriter, name: str, curve: str = "curve") -> None:
-        """Delete the curve named `name` under the curve object `curve` in the
-        `Curves` folder.
-
-        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_curve_object.htm
-
-        :param writer: VBA IO handler
-        :type writer: VbaWriter
-        :param curve: Name of the curve object
-        :type curve: str
-        :param name: Name of the curve item inside the curve object.
-        :type name: str
-        """
+
+    return emit
+
+
+def TrimCurves(
+    writer: VbaWriter,
+    curve_item_1: str,
+    curve_item_2: str,
+    delete_edges_1: int | list[int] | None,
+    delete_edges_2: int | list[int] | None,
+    curve: str = "curve",
+) -> None:
+    """
+    Trim two intersecting items under the Curves folder. Points of intersection created new segments/edges which can be deleted (trimmed).
+    Note that the items must be stored in Curves under the same curve object.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_trimcurves_object.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param curve_item_1: Name of curve item under Curves/`curve` to intersect with `curve_item_2`.
+    :type curve_item_1: str
+    :param curve_item_2: Name of curve item under Curves/`curve` to intersect with `curve_item_1`.
+    :type curve_item_2: str
+    :param delete_edges_1: Edge, or list of edges, of `curve_item_1` defined due to the curve intersection that
+        will be deleted by the Trim operation. If `None`, no edge from this curve is deleted.
+    :type delete_edges_1: int | list[int] | None
+    :param delete_edges_2: Edge, or list of edges, of `curve_item_1` defined due to the curve intersection that
+        will be deleted by the Trim operation. If `None`, no edge from this curve is deleted.
+    :type delete_edges_2: int | list[int] | None
+    :param curve: Name of the folder under Curves where the Ellipse is stored.
+    :type curve: str (default="curve")
+    """
+    writer.write_with(
+        "TrimCurves",
+        _build_trim_curves(
+            curve_item_1, curve_item_2, delete_edges_1, delete_edges_2, curve
+        ),
+    )
+
+
+def NewCurve(writer: VbaWriter, curve: str, name: str | None = None) -> None:
+    """Create a new curve object called `curve` under the `Curve` folder, optionally
+    create a curve called `name` under the `curve` object.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_curve_object.htm
+
+    :param writer: VBA IO handler.
+    :type writer: VbaWriter
+    :param curve: Name of the new curve object under the `Curve` folder.
+    :type curve: str
+    :param name: Name of the new curve under the curve object called `curve`. If this
+        parameter `None`, the default value, then only the curve object will be created.
+    :type name: str | None (default=None)
+    """
+    if name is None:
+        writer.write(f"Curve.NewCurve {VbaWriter.string_repr(curve)}\n")
+    else:
         writer.write(
-            f"Curve.DeleteCurveItem {VbaWriter.string_repr(text=curve)}, {VbaWriter.string_repr(text=name)}\n"
+            f"Curve.NewCurve {VbaWriter.string_repr(curve)}, {VbaWriter.string_repr(name)}\n"
         )
+
+
+def DeleteCurve(writer: VbaWriter, curve: str) -> None:
+    """Delete the curve object called `curve` stored in the `Curves` folder.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_curve_object.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param curve: Name of curve object under `Curve` folder.
+    :type curve: str
+    """
+    writer.write(f"Curve.DeleteCurve {VbaWriter.string_repr(curve)}\n")
+
+
+def DeleteCurveItem(writer: VbaWriter, name: str, curve: str = "curve") -> None:
+    """Delete the curve named `name` under the curve object `curve` in the
+    `Curves` folder.
+
+    See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbacurves/common_vbacurves_curve_object.htm
+
+    :param writer: VBA IO handler
+    :type writer: VbaWriter
+    :param curve: Name of the curve object
+    :type curve: str
+    :param name: Name of the curve item inside the curve object.
+    :type name: str
+    """
+    writer.write(
+        f"Curve.DeleteCurveItem {VbaWriter.string_repr(curve)}, {VbaWriter.string_repr(name)}\n"
+    )
+
+
+class Curves:
+    """The functions of this module collected under the `Curves` name, such that
+    `Curves.Line(...)` and friends keep working."""
+
+    Ellipse = staticmethod(Ellipse)
+    Line = staticmethod(Line)
+    LineBatch = staticmethod(LineBatch)
+    line_emitter = staticmethod(line_emitter)
+    Polygon = staticmethod(Polygon)
+    Polygons = staticmethod(Polygons)
+    TrimCurves = staticmethod(TrimCurves)
+    NewCurve = staticmethod(NewCurve)
+    DeleteCurve = staticmethod(DeleteCurve)
+    DeleteCurveItem = staticmethod(DeleteCurveItem)
@@ -3,7 +3,6 @@
 author: Aaron Gobeyn
 """
 
-from ..utils import wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
 
@@ -18,12 +17,12 @@ class Picks(object):
         :type writer: VbaWriter
         :param name: Name of the solid to pick the face from
         :type name: str
-        :param id: Identity number of the face in that solid
+        :param id: Identity number of the face in that solid, this must be an integer and not the name
+            of a parameter.
         :type id: int
         """
-        writer.write(
-            f"Pick.PickFaceFromId {VbaWriter.string_repr(text=name)}, {wrap_nonstr_in_double_quotes(value=id)}\n"
-        )
+        # The identity number is always an `int`, so it is quoted in place.
+        writer.write(f'Pick.PickFaceFromId {VbaWriter.string_repr(name)}, "{id}"\n')
 
     @staticmethod
     def PickEdgeFromId(
@@ -39,11 +38,58 @@ class Picks(object):
         :type writer: VbaWriter
         :param name: Name of the solid to pick the edge from.
         :type name: str
-        :param edge_id: Identity number of the edge within the solid.
+        :param edge_id: Identity number of the edge within the solid, this must be an integer.
         :type edge_id: int
-        :param vertex_id: Identity number of the starting point of the edge within the solid.
+        :param vertex_id: Identity number of the starting point of the edge within the solid, this must be an integer.
         :type vertex_id: int
         """
+        # The identity numbers are always an `int`, so they are quoted in place.
+        writer.write(
+            f'Pick.PickEdgeFromId {VbaWriter.string_repr(name)}, "{edge_id}", "{vertex_id}"\n'
+        )
+
+    @staticmethod
+    def PickFaceFromIdBatch(writer: VbaWriter, picks: list[tuple[str, int]]) -> None:
+        """Pick the face with identity number `id` of the solid called `name` for every `(name, id)` tuple in
+        `picks`, in order. Faces of different solids can be picked in one call.
+
+        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbapicko/common_vbapicko_pick_object.htm
+
+        :param writer: VBA IO handler
+        :type writer: VbaWriter
+        :param picks: Faces to pick, each entry is a tuple of the `name` and `id` arguments of `PickFaceFromId`.
+        :type picks: list[tuple[str, int]]
+        """
+        if not picks:
+            return
+        s = VbaWriter.string_repr
+        writer.write(
+            "".join([f'Pick.PickFaceFromId {s(name)}, "{id}"\n' for name, id in picks])
+        )
+
+    @staticmethod
+    def PickEdgeFromIdBatch(
+        writer: VbaWriter, picks: list[tuple[str, int, int]]
+    ) -> None:
+        """Pick the edge with identity number `edge_id`, starting at the vertex `vertex_id`, of the solid called
+        `name` for every `(name, edge_id, vertex_id)` tuple in `picks`, in order.
+
+        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbapicko/common_vbapicko_pick_object.htm
+
+        :param writer: VBA IO handler
+        :type writer: VbaWriter
+        :param picks: Edges to pick, each entry is a tuple of the `name`, `edge_id` and `vertex_id`
+            arguments of `PickEdgeFromId`.
+        :type picks: list[tuple[str, int, int]]
+        """
+        if not picks:
+            return
+        s = VbaWriter.string_repr
         writer.write(
-            f"Pick.PickEdgeFromId {VbaWriter.string_repr(text=name)}, {wrap_nonstr_in_double_quotes(value=edge_id)}, {wrap_nonstr_in_double_quotes(value=vertex_id)}\n"
+            "".join(
+                [
+                    f'Pick.PickEdgeFromId {s(name)}, "{edge_id}", "{vertex_id}"\n'
+                    for name, edge_id, vertex_id in picks
+                ]
+            )
         )
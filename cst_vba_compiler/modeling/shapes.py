@@ -3,9 +3,89 @@
 author: Aaron Gobeyn
 """
 
-from ..utils import wrap_nonstr_in_double_quotes
+from typing import NamedTuple
+
+from ..utils import QUOTED_FALSE, QUOTED_TRUE, wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
+# Supported options for the validated arguments.
+_FACE_MODES = frozenset({"PickFace", "ExtrudeCurve", "CoverCurve"})
+_FACE_CURVE_MODES = frozenset({"ExtrudeCurve", "CoverCurve"})
+_ROTATE_MODES = frozenset({"Pointlist", "Picks"})
+_CYLINDER_AXES = frozenset({"x", "y", "z"})
+# Templates for the fixed parts of the contents of the `With` blocks.
+_FACE_TMPL_HEAD = ".Reset\n" ".Name {}\n" ".Type {}\n"
+# The `.StartAngle` line is only present when it is used, so it is filled in as a whole.
+_ROTATE_TMPL = (
+    ".Name {name}\n"
+    ".Component {component}\n"
+    ".NumberOfPickedFaces {number_of_picked_faces}\n"
+    ".Material {material}\n"
+    ".Mode {mode}\n"
+    "{start_angle_line}"
+    ".Angle {angle}\n"
+    ".Height {height}\n"
+    ".RadiusRatio {radius_ratio}\n"
+    ".NSteps {Nsteps}\n"
+    ".SplitClosedEdges {split_closed_edges}\n"
+    ".SegmentedProfile {segmented_profile}\n"
+    ".DeleteBaseFaceSolid {delete_base_face_solid}\n"
+    ".ClearPickedFace {clear_picked_face}\n"
+    ".SimplifySolid {simplify_solid}\n"
+    ".UseAdvancedSegmentedRotation {use_advanced_segmented_rotation}\n"
+    ".CutEndOff {cut_end_off}\n"
+    ".Create\n"
+)
+
+
+class FaceSpec(NamedTuple):
+    """Description of a single face for `Faces.FaceBatch`, the fields have the same
+    meaning as the arguments of `Faces.Face`."""
+
+    name: str
+    mode: str
+    curve: str | None = None
+    twistangle: float | None = None
+    thickness: float | None = None
+    taperangle: float | None = None
+    offset: float | None = None
+
+
+def _build_face(
+    name: str,
+    mode: str,
+    curve: str | None,
+    twistangle: float | None,
+    thickness: float | None,
+    taperangle: float | None,
+    offset: float | None,
+) -> str:
+    """Build the contents of the `With Face` block, see `Faces.Face`."""
+    # Check if the mode is a valid one.
+    assert (
+        mode in _FACE_MODES
+    ), "The provided mode for Face selection is not a valid mode."
+    # Check that if the mode is curve based, a curve is actually provided.
+    assert (
+        mode not in _FACE_CURVE_MODES or curve is not None
+    ), "Mode for face creation is a curved based mode, but no curve was provided."
+
+    q = wrap_nonstr_in_double_quotes
+    s = VbaWriter.string_repr
+    parts: list[str] = [_FACE_TMPL_HEAD.format(s(name), s(mode))]
+    if curve is not None:
+        parts.append(f".Curve {s(curve)}\n")
+    if (offset is not None) and (mode == "PickFace"):
+        parts.append(f".Offset {q(offset)}\n")
+    if taperangle is not None and mode == "ExtrudeCurve":
+        parts.append(f".Taperangle {q(taperangle)}\n")
+    if thickness is not None:
+        parts.append(f".Thickness {q(thickness)}\n")
+    if twistangle is not None and mode == "ExtrudeCurve":
+        parts.append(f".Twistangle {q(twistangle)}\n")
+    parts.append(".Create\n")
+    return "".join(parts)
+
 
 class Component(object):
     @staticmethod
@@ -17,7 +97,7 @@ class Component(object):
         :param name: Name of the component to create.
         :type name: str
         """
-        writer.write(f"Component.New {VbaWriter.string_repr(text=name)}\n")
+        writer.write(f"Component.New {VbaWriter.string_repr(name)}\n")
 
     @staticmethod
     def Delete(writer: VbaWriter, name: str) -> None:
@@ -28,7 +108,7 @@ class Component(object):
         :param name: Name of the component to delete.
         :type name: str
         """
-        writer.write(f"Component.Delete {VbaWriter.string_repr(text=name)}\n")
+        writer.write(f"Component.Delete {VbaWriter.string_repr(name)}\n")
 
     @staticmethod
     def Rename(writer: VbaWriter, old_name: str, new_name: str) -> None:
@@ -42,7 +122,7 @@ class Component(object):
         :type new_name: str
         """
         writer.write(
-            f"Component.Rename {VbaWriter.string_repr(text=old_name)}, {VbaWriter.string_repr(text=new_name)}\n"
+            f"Component.Rename {VbaWriter.string_repr(old_name)}, {VbaWriter.string_repr(new_name)}\n"
         )
 
 
@@ -92,37 +172,42 @@ class Faces(object):
             0.0. This argument is always optional.
         :type offset: float | None (default=None)
         """
-        # Check if the mode is a valid one.
-        assert (
-            mode == "PickFace" or mode == "ExtrudeCurve" or mode == "CoverCurve"
-        ), "The provided mode for Face selection is not a valid mode."
-        # Check that if the mode is curve based, a curve is actually provided.
-        assert (mode == "ExtrudeCurve" and curve is not None) or (
-            mode == "CoverCurve" and curve is not None
-        ), "Mode for face creation is a curved based mode, but no curve was provided."
-
-        writer.start_with(structure="Face")
-        writer.write(".Reset\n")
-        writer.write(f".Name {VbaWriter.string_repr(text=name)}\n")
-        writer.write(f".Type {VbaWriter.string_repr(text=mode)}\n")
-        if curve is not None:
-            writer.write(f".Curve {VbaWriter.string_repr(text=curve)}\n")
-        if (offset is not None) and (mode == "PickFace"):
-            writer.write(f".Offset {wrap_nonstr_in_double_quotes(value=offset)}\n")
-        if taperangle is not None and mode == "ExtrudeCurve":
-            writer.write(
-                f".Taperangle {wrap_nonstr_in_double_quotes(value=taperangle)}\n"
-            )
-        if thickness is not None:
-            writer.write(
-                f".Thickness {wrap_nonstr_in_double_quotes(value=thickness)}\n"
-            )
-        if twistangle is not None and mode == "ExtrudeCurve":
-            writer.write(
-                f".Twistangle {wrap_nonstr_in_double_quotes(value=twistangle)}\n"
-            )
-        writer.write(".Create\n")
-        writer.end_with()
+        writer.write_with(
+            "Face",
+            _build_face(name, mode, curve, twistangle, thickness, taperangle, offset),
+        )
+
+    @staticmethod
+    def FaceBatch(writer: VbaWriter, faces: list[FaceSpec]) -> None:
+        """Create a Face in the `Faces` folder for every `FaceSpec` in `faces`, each spec selects its own mode
+        and curve as described in `Face`. The faces follow each other in one `With Face` block.
+
+        See: https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/common_vbafaces/common_vbafaces_face_object.htm
+
+        :param writer: VBA IO handler
+        :type writer: VbaWriter
+        :param faces: Faces to create, each entry holds the arguments of `Face` apart from the writer.
+        :type faces: list[FaceSpec]
+        """
+        if not faces:
+            return
+        writer.write_with(
+            "Face",
+            "".join(
+                [
+                    _build_face(
+                        face.name,
+                        face.mode,
+                        face.curve,
+                        face.twistangle,
+                        face.thickness,
+                        face.taperangle,
+                        face.offset,
+                    )
+                    for face in faces
+                ]
+            ),
+        )
 
     @staticmethod
     def DeleteFace(writer: VbaWriter, name: str) -> None:
@@ -135,7 +220,7 @@ class Faces(object):
         :param name: Name of the face to delete.
         :type name: str
         """
-        writer.write(f"Face.Delete {VbaWriter.string_repr(text=name)}\n")
+        writer.write(f"Face.Delete {VbaWriter.string_repr(name)}\n")
 
 
 class FromProfile2D(object):
@@ -211,47 +296,43 @@ class FromProfile2D(object):
         :type cut_end_off: bool (default=False)
         """
         assert (
-            mode == "Pointlist" or mode == "Picks"
+            mode in _ROTATE_MODES
         ), "Provided mode is not supported, must be Pointlist or Picks."
 
-        writer.start_with(structure="Rotate")
-        writer.write(f".Name {VbaWriter.string_repr(text=name)}\n")
-        writer.write(f".Component {VbaWriter.string_repr(text=component)}\n")
-        writer.write(
-            f".NumberOfPickedFaces {wrap_nonstr_in_double_quotes(value=number_of_picked_faces)}\n"
-        )
-        writer.write(f".Material {VbaWriter.string_repr(text=material)}\n")
-        writer.write(f".Mode {VbaWriter.string_repr(text=mode)}\n")
+        q = wrap_nonstr_in_double_quotes
+        s = VbaWriter.string_repr
+        # The flags are always a `bool`, so they are quoted in place.
+        T, F = QUOTED_TRUE, QUOTED_FALSE
         if start_angle is not None and mode == "Pointlist":
-            writer.write(f".StartAngle {wrap_nonstr_in_double_quotes(start_angle)}\n")
-        writer.write(f".Angle {wrap_nonstr_in_double_quotes(value=angle)}\n")
-        writer.write(f".Height {wrap_nonstr_in_double_quotes(value=height)}\n")
-        writer.write(
-            f".RadiusRatio {wrap_nonstr_in_double_quotes(value=radius_ratio)}\n"
-        )
-        writer.write(f".NSteps {wrap_nonstr_in_double_quotes(value=Nsteps)}\n")
-        writer.write(
-            f".SplitClosedEdges {wrap_nonstr_in_double_quotes(value=split_closed_edges)}\n"
-        )
-        writer.write(
-            f".SegmentedProfile {wrap_nonstr_in_double_quotes(value=segmented_profile)}\n"
-        )
-        writer.write(
-            f".DeleteBaseFaceSolid {wrap_nonstr_in_double_quotes(value=delete_base_face_solid)}\n"
-        )
-        writer.write(
-            f".ClearPickedFace {wrap_nonstr_in_double_quotes(value=clear_picked_face)}\n"
-        )
-        writer.write(
-            f".SimplifySolid {wrap_nonstr_in_double_quotes(value=simplify_solid)}\n"
-        )
-        writer.write(
-            f".UseAdvancedSegmentedRotation {wrap_nonstr_in_double_quotes(value=use_advanced_segmented_rotation)}\n"
+            start_angle_line: str = f".StartAngle {q(start_angle)}\n"
+        else:
+            start_angle_line: str = ""
+        writer.write_with(
+            "Rotate",
+            _ROTATE_TMPL.format_map(
+                {
+                    "name": s(name),
+                    "component": s(component),
+                    "number_of_picked_faces": f'"{number_of_picked_faces}"',
+                    "material": s(material),
+                    "mode": s(mode),
+                    "start_angle_line": start_angle_line,
+                    "angle": q(angle),
+                    "height": q(height),
+                    "radius_ratio": q(radius_ratio),
+                    "Nsteps": f'"{Nsteps}"',
+                    "split_closed_edges": T if split_closed_edges else F,
+                    "segmented_profile": T if segmented_profile else F,
+                    "delete_base_face_solid": T if delete_base_face_solid else F,
+                    "clear_picked_face": T if clear_picked_face else F,
+                    "simplify_solid": T if simplify_solid else F,
+                    "use_advanced_segmented_rotation": T
+                    if use_advanced_segmented_rotation
+                    else F,
+                    "cut_end_off": T if cut_end_off else F,
+                }
+            ),
         )
-        writer.write(f".CutEndOff {wrap_nonstr_in_double_quotes(value=cut_end_off)}\n")
-
-        writer.write(".Create\n")
-        writer.end_with()
 
 
 class Shapes(object):
@@ -294,38 +375,31 @@ class Shapes(object):
             surface.
         :type segments: int (default=0)
         """
-        assert axis in [
-            "x",
-            "y",
-            "z",
-        ], "Given argument for axis is not of the available options."
-        writer.start_with(structure="Cylinder")
-        writer.write(".Reset\n")
-        writer.write(f".Name {VbaWriter.string_repr(text=name)}\n")
-        writer.write(f".Component {VbaWriter.string_repr(text=component)}\n")
-        writer.write(f".Material {VbaWriter.string_repr(text=material)}\n")
-        writer.write(f".Axis {VbaWriter.string_repr(text=axis)}\n")
-        writer.write(
-            f".Outerradius {wrap_nonstr_in_double_quotes(value=outer_radius)}\n"
-        )
-        writer.write(
-            f".Innerradius {wrap_nonstr_in_double_quotes(value=inner_radius)}\n"
-        )
-        writer.write(f".Xcenter {wrap_nonstr_in_double_quotes(value=center[0])}\n")
-        writer.write(f".Ycenter {wrap_nonstr_in_double_quotes(value=center[1])}\n")
-        writer.write(f".Zcenter {wrap_nonstr_in_double_quotes(value=center[2])}\n")
+        assert (
+            axis in _CYLINDER_AXES
+        ), "Given argument for axis is not of the available options."
+        center_x, center_y, center_z = center
+        range_min, range_max = range_along_axis
+        q = wrap_nonstr_in_double_quotes
+        s = VbaWriter.string_repr
+        parts: list[str] = [
+            ".Reset\n",
+            f".Name {s(name)}\n",
+            f".Component {s(component)}\n",
+            f".Material {s(material)}\n",
+            f".Axis {s(axis)}\n",
+            f".Outerradius {q(outer_radius)}\n",
+            f".Innerradius {q(inner_radius)}\n",
+            f".Xcenter {q(center_x)}\n",
+            f".Ycenter {q(center_y)}\n",
+            f".Zcenter {q(center_z)}\n",
+        ]
         if axis == "x":
-            writer.write(
-                f".Xrange {wrap_nonstr_in_double_quotes(value=range_along_axis[0])}, {wrap_nonstr_in_double_quotes(value=range_along_axis[1])}\n"
-            )
+            parts.append(f".Xrange {q(range_min)}, {q(range_max)}\n")
         elif axis == "y":
-            writer.write(
-                f".Yrange {wrap_nonstr_in_double_quotes(value=range_along_axis[0])}, {wrap_nonstr_in_double_quotes(value=range_along_axis[1])}\n"
-            )
+            parts.append(f".Yrange {q(range_min)}, {q(range_max)}\n")
         else:
-            writer.write(
-                f".Zrange {wrap_nonstr_in_double_quotes(value=range_along_axis[0])}, {wrap_nonstr_in_double_quotes(value=range_along_axis[1])}\n"
-            )
-        writer.write(f".Segments {wrap_nonstr_in_double_quotes(value=segments)}\n")
-        writer.write(".Create\n")
-        writer.end_with()
+            parts.append(f".Zrange {q(range_min)}, {q(range_max)}\n")
+        parts.append(f".Segments {q(segments)}\n")
+        parts.append(".Create\n")
+        writer.write_with("Cylinder", "".join(parts))
@@ -13,5 +13,23 @@ class Solids(object):
         solid is stored under `solid_1` and `solid_2` is deleted in the process.
         """
         writer.write(
-            f"Solid.Add {VbaWriter.string_repr(text=solid_1)}, {VbaWriter.string_repr(text=solid_2)}\n"
+            f"Solid.Add {VbaWriter.string_repr(solid_1)}, {VbaWriter.string_repr(solid_2)}\n"
         )
+
+    @staticmethod
+    def AddChain(writer: VbaWriter, target: str, others: list[str]) -> None:
+        """Boolean addition of every solid in `others` to the solid called `target`, in the order of `others`.
+        The resulting solid is stored under `target` and the solids in `others` are deleted in the process.
+
+        :param writer: VBA IO handler
+        :type writer: VbaWriter
+        :param target: Name of the solid that the other solids are added to.
+        :type target: str
+        :param others: Names of the solids to add to `target`, in order.
+        :type others: list[str]
+        """
+        if not others:
+            return
+        s = VbaWriter.string_repr
+        prefix: str = f"Solid.Add {s(target)}, "
+        writer.write("".join([f"{prefix}{s(other)}\n" for other in others]))
@@ -3,9 +3,31 @@
 author: Aaron Gobeyn
 """
 
-from ..utils import wrap_nonstr_in_double_quotes
+from ..utils import QUOTED_FALSE, QUOTED_TRUE, wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
+# Supported options for the object type and method of a transformation.
+_TRANSFORM_OBJECTS = frozenset({"Shape"})
+_TRANSFORM_METHODS = frozenset({"Mirror", "Translate"})
+# Templates for the fixed parts of the contents of the `With Transform` block.
+_TRANSFORM_TMPL_HEAD = ".Reset\n" ".Name {}\n" ".Origin {}\n"
+_TRANSFORM_TMPL_TAIL = (
+    ".MultipleObjects {}\n"
+    ".GroupObjects {}\n"
+    ".Transform {}, {}\n"
+    ".Repetitions {}\n"
+)
+# Templates for the contents of the `With Transform` block of `TranslateBatch`.
+_TRANSLATE_BATCH_TMPL_HEAD = (
+    ".Reset\n"
+    ".Vector {}\n"
+    '.UsePickedPoints "False"\n'
+    ".MultipleObjects {}\n"
+    ".GroupObjects {}\n"
+    ".Repetitions {}\n"
+)
+_TRANSLATE_BATCH_TMPL_ITEM = ".Name {}\n" '.Transform "Shape", "Translate"\n'
+
 
 class Transform(object):
     # NOTE: Only mirroring and translation of shapes has been implemented.
@@ -68,46 +90,121 @@ class Transform(object):
             been picked and `use_picked_points` is `True`. In all other cases this should be set to `False`.
         :type invert_picked_points: bool | None (default=None)
         """
-        object_options = ["Shape"]
-        method_options = ["Mirror", "Translate"]
+        writer.write(
+            Transform.TransformText(
+                name,
+                transform_object_type,
+                transform_method,
+                plane_normal,
+                vector,
+                origin,
+                center,
+                copy,
+                unite,
+                repetitions,
+                use_picked_points,
+                invert_picked_points,
+            )
+        )
 
+    @staticmethod
+    def TransformText(
+        name: str,
+        transform_object_type: str,
+        transform_method: str,
+        plane_normal: tuple[float, float, float] | None = None,
+        vector: tuple[float, float, float] | None = None,
+        origin: str = "ShapeCenter",
+        center: tuple[float, float, float] | None = None,
+        copy: bool = False,
+        unite: bool = False,
+        repetitions: int = 1,
+        use_picked_points: bool | None = None,
+        invert_picked_points: bool | None = None,
+    ) -> str:
+        """Build the `With Transform` block that `Transform` writes and return it unindented, e.g. to follow a
+        transformation directly with the picks or solid operations that act on its result. The parameters are
+        those of `Transform` without the writer.
+        """
         assert (
-            transform_object_type in object_options
+            transform_object_type in _TRANSFORM_OBJECTS
         ), "Object type for the transformation is not of the supported options."
         assert (
-            transform_method in method_options
+            transform_method in _TRANSFORM_METHODS
         ), "Transformation method is not of the supported options"
 
-        writer.start_with(structure="Transform")
-        writer.write(".Reset\n")
-        writer.write(f".Name {VbaWriter.string_repr(text=name)}\n")
-        writer.write(f".Origin {VbaWriter.string_repr(text=origin)}\n")
+        q = wrap_nonstr_in_double_quotes
+        s = VbaWriter.string_repr
+        parts: list[str] = [_TRANSFORM_TMPL_HEAD.format(s(name), s(origin))]
         if center is not None:
-            writer.write(
-                f".Center {wrap_nonstr_in_double_quotes(value=center[0])}, {wrap_nonstr_in_double_quotes(value=center[1])}, {wrap_nonstr_in_double_quotes(value=center[2])}\n"
-            )
+            parts.append(f".Center {', '.join(map(q, center))}\n")
         if plane_normal is not None:
-            writer.write(
-                f".PlaneNormal {wrap_nonstr_in_double_quotes(value=plane_normal[0])}, {wrap_nonstr_in_double_quotes(value=plane_normal[1])}, {wrap_nonstr_in_double_quotes(value=plane_normal[2])}\n"
-            )
+            parts.append(f".PlaneNormal {', '.join(map(q, plane_normal))}\n")
         if vector is not None:
-            writer.write(
-                f".Vector {wrap_nonstr_in_double_quotes(value=vector[0])}, {wrap_nonstr_in_double_quotes(value=vector[1])}, {wrap_nonstr_in_double_quotes(value=vector[2])}\n"
-            )
+            parts.append(f".Vector {', '.join(map(q, vector))}\n")
         if use_picked_points is not None:
-            writer.write(
-                f".UsePickedPoints {wrap_nonstr_in_double_quotes(value=use_picked_points)}\n"
+            parts.append(
+                '.UsePickedPoints "True"\n'
+                if use_picked_points
+                else '.UsePickedPoints "False"\n'
             )
         if invert_picked_points is not None:
-            writer.write(
-                f".InvertPickedPoints {wrap_nonstr_in_double_quotes(value=invert_picked_points)}\n"
+            parts.append(
+                '.InvertPickedPoints "True"\n'
+                if invert_picked_points
+                else '.InvertPickedPoints "False"\n'
+            )
+        parts.append(
+            _TRANSFORM_TMPL_TAIL.format(
+                QUOTED_TRUE if copy else QUOTED_FALSE,
+                QUOTED_TRUE if unite else QUOTED_FALSE,
+                s(transform_object_type),
+                s(transform_method),
+                f'"{repetitions}"',
             )
-        writer.write(f".MultipleObjects {wrap_nonstr_in_double_quotes(value=copy)}\n")
-        writer.write(f".GroupObjects {wrap_nonstr_in_double_quotes(value=unite)}\n")
-        writer.write(
-            f".Transform {VbaWriter.string_repr(text=transform_object_type)}, {VbaWriter.string_repr(text=transform_method)}\n"
-        )
-        writer.write(
-            f".Repetitions {wrap_nonstr_in_double_quotes(value=repetitions)}\n"
         )
-        writer.end_with()
+        return VbaWriter.with_block("Transform", "".join(parts))
+
+    @staticmethod
+    def TranslateBatch(
+        writer: VbaWriter,
+        names: list[str],
+        vector: tuple[float, float, float],
+        copy: bool = False,
+        unite: bool = False,
+        repetitions: int = 1,
+    ) -> None:
+        """Translate every shape in `names` by the same `vector`. The vector, copy, unite and repetition settings
+        are set once at the top of the `With Transform` block, after which each shape only needs its `.Name` and
+        `.Transform "Shape", "Translate"` lines.
+
+        See https://space.mit.edu/RADIO/CST_online/mergedProjects/VBA_3D/special_vbatransformo/special_vbatransformo_transform_object.htm
+
+        :param writer: VBA IO handler
+        :type writer: VbaWriter
+        :param names: Names of the shapes to translate.
+        :type names: list[str]
+        :param vector: Translation vector.
+        :type vector: tuple[float, float, float]
+        :param copy: If `True`, the new solids are copied and the originals untouched, if `False` the originals are deleted.
+        :type copy: bool (default=False)
+        :param unite: If `True`, each new object created during transformation (requires `copy` to be `True`) is united with
+            its original object, otherwise the objects will remain separate.
+        :type unite: bool (default=False)
+        :param repetitions: Amount of times the translation should be applied to each shape.
+        :type repetitions: int (default=1)
+        """
+        if not names:
+            return
+        q = wrap_nonstr_in_double_quotes
+        item = _TRANSLATE_BATCH_TMPL_ITEM.format
+        parts: list[str] = [
+            _TRANSLATE_BATCH_TMPL_HEAD.format(
+                ", ".join(map(q, vector)),
+                QUOTED_TRUE if copy else QUOTED_FALSE,
+                QUOTED_TRUE if unite else QUOTED_FALSE,
+                f'"{repetitions}"',
+            )
+        ]
+        parts.extend([item(VbaWriter.string_repr(name)) for name in names])
+        writer.write_with("Transform", "".join(parts))
@@ -3,9 +3,15 @@
 author: Aaron Gobeyn
 """
 
-from ..utils import wrap_nonstr_in_double_quotes
+from ..utils import QUOTED_FALSE, QUOTED_TRUE
 from ..writer import VbaWriter
 
+# The static lines of the project commands, these can also be joined directly into a larger text
+# that is written at once, e.g. `writer.write(SAVE + QUIT)`.
+FILENEW = "FileNew\n"
+QUIT = "Quit\n"
+SAVE = "Save\n"
+
 
 class FileHandling(object):
     """See http://www.mweda.com/cst/cst2013/mergedProjects/VBA_Help_DS/special_vbacommands/projectobject.htm"""
@@ -17,7 +23,7 @@ class FileHandling(object):
         :param writer: VBA IO handler
         :type writer: VbaWriter
         """
-        writer.write("FileNew\n")
+        writer.write(FILENEW)
 
     @staticmethod
     def OpenFile(writer: VbaWriter, filepath: str) -> None:
@@ -28,7 +34,7 @@ class FileHandling(object):
         :param filepath: File path to the existing CST project.
         :type filepath: str
         """
-        writer.write(f"OpenFile {VbaWriter.string_repr(text=filepath)}\n")
+        writer.write(f"OpenFile {VbaWriter.string_repr(filepath)}\n")
 
     @staticmethod
     def Quit(writer: VbaWriter) -> None:
@@ -37,7 +43,7 @@ class FileHandling(object):
         :param writer: VBA IO handler
         :type writer: VbaWriter
         """
-        writer.write("Quit\n")
+        writer.write(QUIT)
 
     @staticmethod
     def Save(writer: VbaWriter) -> None:
@@ -46,7 +52,7 @@ class FileHandling(object):
         :param writer: VBA IO handler
         :type writer: VbaWriter
         """
-        writer.write("Save\n")
+        writer.write(SAVE)
 
     @staticmethod
     def SaveAs(writer: VbaWriter, filepath: str, include_results: bool) -> None:
@@ -61,5 +67,5 @@ class FileHandling(object):
         :type include_results: bool
         """
         writer.write(
-            f"SaveAs {VbaWriter.string_repr(text=filepath)}, {wrap_nonstr_in_double_quotes(value=include_results)}\n"
+            f"SaveAs {VbaWriter.string_repr(filepath)}, {QUOTED_TRUE if include_results else QUOTED_FALSE}\n"
         )
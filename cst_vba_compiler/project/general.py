@@ -1,9 +1,12 @@
 """ Python interface for general project managing methods in CST
 """
 
-from ..utils import wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
+# Both possible lines of `DisableInteraction`.
+_SET_LOCK_TRUE = 'SetLock "True"\n'
+_SET_LOCK_FALSE = 'SetLock "False"\n'
+
 
 class General(object):
     @staticmethod
@@ -19,4 +22,4 @@ class General(object):
         :param disable: Disable user interaction of `True`.
         :type disable: bool (default=False)
         """
-        writer.write(f"SetLock {wrap_nonstr_in_double_quotes(value=disable)}\n")
+        writer.write(_SET_LOCK_TRUE if disable else _SET_LOCK_FALSE)
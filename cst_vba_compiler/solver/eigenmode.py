@@ -3,9 +3,30 @@
 author: Aaron Gobeyn
 """
 
-from ..utils import wrap_nonstr_in_double_quotes
+from ..utils import QUOTED_FALSE, QUOTED_TRUE
 from ..writer import VbaWriter
 
+# Supported mesh types.
+_HEX_MESH = "Hexahedral Mesh"
+_TET_MESH = "Tetrahedral Mesh"
+_MESH_TYPES = frozenset({_HEX_MESH, _TET_MESH})
+# Template for the contents of the `With EigenmodeSolver` block, the mesh adaptation
+# method depends on the mesh type.
+_EIGENMODE_TMPL = (
+    ".Reset\n"
+    ".SetMeshType {}\n"
+    ".SetMeshAdaptation{} {}\n"
+    '.SetNumberOfModes "{}"\n'
+    ".Start\n"
+)
+# The mesh type and the adaptation method are fixed per mesh type, so they are formatted in at import.
+_EIGENMODE_TMPL_HEX = _EIGENMODE_TMPL.format(
+    VbaWriter.string_repr(_HEX_MESH), "Hex", "{}", "{}"
+)
+_EIGENMODE_TMPL_TET = _EIGENMODE_TMPL.format(
+    VbaWriter.string_repr(_TET_MESH), "Tet", "{}", "{}"
+)
+
 
 # NOTE: We have not implemented all of the possible options.
 def EigenmodeSolver(
@@ -29,23 +50,27 @@ def EigenmodeSolver(
     :param auto_tetra_mesh: Enable automatic tetrahedral mesh adaptation.
     :type auto_tetra_mesh: bool (default=False)
     """
-    assert mesh_type in [
-        "Hexahedral Mesh",
-        "Tetrahedral Mesh",
-    ], "Provided mesh type is not supported."
-    writer.start_with(structure="EigenmodeSolver")
-    writer.write(".Reset\n")
-    writer.write(f".SetMeshType {VbaWriter.string_repr(text=mesh_type)}\n")
-    if mesh_type == "Hexahedral Mesh":
-        writer.write(
-            f".SetMeshAdaptationHex {wrap_nonstr_in_double_quotes(value=auto_hex_mesh)}\n"
-        )
-    else:
-        writer.write(
-            f".SetMeshAdaptationTet {wrap_nonstr_in_double_quotes(value=auto_tetra_mesh)}\n"
-        )
     writer.write(
-        f".SetNumberOfModes {wrap_nonstr_in_double_quotes(value=number_of_modes)}\n"
+        EigenmodeSolverText(number_of_modes, mesh_type, auto_hex_mesh, auto_tetra_mesh)
+    )
+
+
+def EigenmodeSolverText(
+    number_of_modes: int,
+    mesh_type: str,
+    auto_hex_mesh: bool = False,
+    auto_tetra_mesh: bool = False,
+) -> str:
+    """Return the `With EigenmodeSolver` block of `EigenmodeSolver` as a string without writing it, such that
+    it can be joined with the preceding solver settings and written at once. See `EigenmodeSolver` for the parameters.
+    """
+    assert mesh_type in _MESH_TYPES, "Provided mesh type is not supported."
+    if mesh_type == _HEX_MESH:
+        template: str = _EIGENMODE_TMPL_HEX
+        adaptation: str = QUOTED_TRUE if auto_hex_mesh else QUOTED_FALSE
+    else:
+        template: str = _EIGENMODE_TMPL_TET
+        adaptation: str = QUOTED_TRUE if auto_tetra_mesh else QUOTED_FALSE
+    return VbaWriter.with_block(
+        "EigenmodeSolver", template.format(adaptation, number_of_modes)
     )
-    writer.write(".Start\n")
-    writer.end_with()
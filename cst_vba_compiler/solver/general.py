@@ -6,6 +6,8 @@ author: Aaron Gobeyn
 from ..utils import wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
+_FREQUENCY_RANGE_TMPL = "Solver.FrequencyRange {}, {}\n"
+
 
 class SolverSettings(object):
     @staticmethod
@@ -19,6 +21,6 @@ class SolverSettings(object):
             can be set in global.units
         :type frequency_range: tuple[float, float]
         """
-        writer.write(
-            f"Solver.FrequencyRange {wrap_nonstr_in_double_quotes(value=frequency_range[0])}, {wrap_nonstr_in_double_quotes(value=frequency_range[1])}\n"
-        )
+        q = wrap_nonstr_in_double_quotes
+        f_min, f_max = frequency_range
+        writer.write(_FREQUENCY_RANGE_TMPL.format(q(f_min), q(f_max)))
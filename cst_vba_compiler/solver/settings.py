@@ -3,9 +3,63 @@
 author: Aaron Gobeyn
 """
 
-from ..utils import wrap_nonstr_in_double_quotes
+from functools import lru_cache
+
+from ..utils import QUOTED_FALSE, QUOTED_TRUE, wrap_nonstr_in_double_quotes
 from ..writer import VbaWriter
 
+# Supported material and thermal types of the background.
+_MATERIAL_TYPES = frozenset({"normal", "pec"})
+_THERMAL_TYPES = frozenset({"normal", "ptc"})
+# Templates for the lines of the bounds of the background in each direction.
+_BACKGROUND_TMPL_X = ".XminSpace {}\n" ".XmaxSpace {}\n"
+_BACKGROUND_TMPL_Y = ".YminSpace {}\n" ".YmaxSpace {}\n"
+_BACKGROUND_TMPL_Z = ".ZminSpace {}\n" ".ZmaxSpace {}\n"
+# Templates for the lines of the boundary conditions in each direction.
+_BOUNDARY_TMPL_X = ".Xmin {}\n" ".Xmax {}\n"
+_BOUNDARY_TMPL_Y = ".Ymin {}\n" ".Ymax {}\n"
+_BOUNDARY_TMPL_Z = ".Zmin {}\n" ".Zmax {}\n"
+_BOUNDARY_TMPL_ALL = ".Xmin {}\n"
+_APPLY_IN_ALL_DIRECTIONS_TRUE = f".ApplyInAllDirections {QUOTED_TRUE}\n"
+_APPLY_IN_ALL_DIRECTIONS_FALSE = f".ApplyInAllDirections {QUOTED_FALSE}\n"
+
+
+@lru_cache(maxsize=64)
+def _background_template(
+    has_epsilon: bool,
+    has_mu: bool,
+    has_electric_conductivity: bool,
+    has_x_bounds: bool,
+    has_y_bounds: bool,
+    has_z_bounds: bool,
+    has_thermal_type: bool,
+    has_thermal_conductivity: bool,
+) -> str:
+    """Build the format string of the `Background` block for the given combination of optional
+    arguments. Only the lines of the arguments that are set are included, so the result can be
+    formatted with the values of the set arguments in order. The result is cached, such that the
+    template for a given combination is only assembled once, see also `_ascii_template`.
+    """
+    lines: list[str] = [".Reset\n", ".Type {}\n"]
+    if has_epsilon:
+        lines.append(".Epsilon {}\n")
+    if has_mu:
+        lines.append(".Mu {}\n")
+    if has_electric_conductivity:
+        lines.append(".ElConductivity {}\n")
+    if has_x_bounds:
+        lines.append(_BACKGROUND_TMPL_X)
+    if has_y_bounds:
+        lines.append(_BACKGROUND_TMPL_Y)
+    if has_z_bounds:
+        lines.append(_BACKGROUND_TMPL_Z)
+    if has_thermal_type:
+        lines.append(".ThermalType {}\n")
+    if has_thermal_conductivity:
+        lines.append(".ThermalConductivity {}\n")
+    lines.append(".ApplyInAllDirections {}\n")
+    return "".join(lines)
+
 
 class Settings(object):
     # NOTE: We used everything listed on the documentation website, but there are a lot more options in CST itself, maybe they can also be accessed
@@ -54,58 +108,80 @@ class Settings(object):
         :param thermal_conductivity: Set thermal conductivity in W/K/m, set to "0.0" by default.
         :type thermal_conductivity: float | None (default=None)
         """
-        assert material_type in [
-            "normal",
-            "pec",
-        ], "Material type is not of the valid options: 'normal' or 'pec'."
-        if thermal_type is not None:
-            assert thermal_type in [
-                "normal",
-                "type",
-            ], "Thermal type is not of the valid options: 'normal' or 'ptc'"
-
-        writer.start_with(structure="Background")
-        writer.write(".Reset\n")
-        writer.write(f".Type {VbaWriter.string_repr(text=material_type)}\n")
+        writer.write(
+            Settings.BackgroundText(
+                material_type,
+                apply_in_all_directions,
+                epsilon,
+                mu,
+                electric_conductivity,
+                x_bounds,
+                y_bounds,
+                z_bounds,
+                thermal_type,
+                thermal_conductivity,
+            )
+        )
+
+    @staticmethod
+    def BackgroundText(
+        material_type: str,
+        apply_in_all_directions: bool,
+        epsilon: float | None = None,
+        mu: float | None = None,
+        electric_conductivity: float | None = None,
+        x_bounds: tuple[float, float] | None = None,
+        y_bounds: tuple[float, float] | None = None,
+        z_bounds: tuple[float, float] | None = None,
+        thermal_type: str | None = None,
+        thermal_conductivity: float | None = None,
+    ) -> str:
+        """Return the `With Background` block of `Background` as a string without writing it, such that
+        several blocks can be joined and written at once. See `Background` for the parameters.
+        """
+        assert (
+            material_type in _MATERIAL_TYPES
+        ), "Material type is not of the valid options: 'normal' or 'pec'."
+        assert (
+            thermal_type is None or thermal_type in _THERMAL_TYPES
+        ), "Thermal type is not of the valid options: 'normal' or 'ptc'"
+
+        q = wrap_nonstr_in_double_quotes
+        s = VbaWriter.string_repr
+        # Collect the values in the order in which they appear in the template.
+        values: list[str] = [s(material_type)]
         if epsilon is not None:
-            writer.write(f".Epsilon {wrap_nonstr_in_double_quotes(value=epsilon)}\n")
+            values.append(q(epsilon))
         if mu is not None:
-            writer.write(f".Mu {wrap_nonstr_in_double_quotes(value=mu)}\n")
+            values.append(q(mu))
         if electric_conductivity is not None:
-            writer.write(
-                f".ElConductivity {wrap_nonstr_in_double_quotes(value=electric_conductivity)}\n"
-            )
+            values.append(q(electric_conductivity))
         if x_bounds is not None:
-            writer.write(
-                f".XminSpace {wrap_nonstr_in_double_quotes(value=x_bounds[0])}\n"
-            )
-            writer.write(
-                f".XmaxSpace {wrap_nonstr_in_double_quotes(value=x_bounds[1])}\n"
-            )
+            x_min, x_max = x_bounds
+            values.extend((q(x_min), q(x_max)))
         if y_bounds is not None:
-            writer.write(
-                f".YminSpace {wrap_nonstr_in_double_quotes(value=y_bounds[0])}\n"
-            )
-            writer.write(
-                f".YmaxSpace {wrap_nonstr_in_double_quotes(value=y_bounds[1])}\n"
-            )
+            y_min, y_max = y_bounds
+            values.extend((q(y_min), q(y_max)))
         if z_bounds is not None:
-            writer.write(
-                f".ZminSpace {wrap_nonstr_in_double_quotes(value=z_bounds[0])}\n"
-            )
-            writer.write(
-                f".ZmaxSpace {wrap_nonstr_in_double_quotes(value=z_bounds[1])}\n"
-            )
+            z_min, z_max = z_bounds
+            values.extend((q(z_min), q(z_max)))
         if thermal_type is not None:
-            writer.write(f".ThermalType {VbaWriter.string_repr(text=thermal_type)}\n")
+            values.append(s(thermal_type))
         if thermal_conductivity is not None:
-            writer.write(
-                f".ThermalConductivity {wrap_nonstr_in_double_quotes(value=thermal_conductivity)}\n"
-            )
-        writer.write(
-            f".ApplyInAllDirections {wrap_nonstr_in_double_quotes(value=apply_in_all_directions)}\n"
+            values.append(q(thermal_conductivity))
+        values.append(QUOTED_TRUE if apply_in_all_directions else QUOTED_FALSE)
+
+        template: str = _background_template(
+            has_epsilon=epsilon is not None,
+            has_mu=mu is not None,
+            has_electric_conductivity=electric_conductivity is not None,
+            has_x_bounds=x_bounds is not None,
+            has_y_bounds=y_bounds is not None,
+            has_z_bounds=z_bounds is not None,
+            has_thermal_type=thermal_type is not None,
+            has_thermal_conductivity=thermal_conductivity is not None,
         )
-        writer.end_with()
+        return VbaWriter.with_block("Background", template.format(*values))
 
     # NOTE: There is a lot listed on the documentation, we've only implemented what we needed so far.
     @staticmethod
@@ -152,21 +228,44 @@ class Settings(object):
             provided in that case.
         :type boundary_type: str | None (default=None)
         """
-        writer.start_with(structure="Boundary")
         writer.write(
-            f".ApplyInAllDirections {wrap_nonstr_in_double_quotes(value=apply_in_all_directions)}\n"
+            Settings.BoundariesText(
+                apply_in_all_directions,
+                x_boundaries,
+                y_boundaries,
+                z_boundaries,
+                boundary_type,
+            )
         )
+
+    @staticmethod
+    def BoundariesText(
+        apply_in_all_directions: bool,
+        x_boundaries: tuple[str, str] | None = None,
+        y_boundaries: tuple[str, str] | None = None,
+        z_boundaries: tuple[str, str] | None = None,
+        boundary_type: str | None = None,
+    ) -> str:
+        """Return the `With Boundary` block of `Boundaries` as a string without writing it, such that
+        several blocks can be joined and written at once. See `Boundaries` for the parameters.
+        """
+        s = VbaWriter.string_repr
+        parts: list[str] = [
+            _APPLY_IN_ALL_DIRECTIONS_TRUE
+            if apply_in_all_directions
+            else _APPLY_IN_ALL_DIRECTIONS_FALSE
+        ]
         if apply_in_all_directions is False:
             if x_boundaries is not None:
-                writer.write(f".Xmin {VbaWriter.string_repr(text=x_boundaries[0])}\n")
-                writer.write(f".Xmax {VbaWriter.string_repr(text=x_boundaries[1])}\n")
+                x_min, x_max = x_boundaries
+                parts.append(_BOUNDARY_TMPL_X.format(s(x_min), s(x_max)))
             if y_boundaries is not None:
-                writer.write(f".Ymin {VbaWriter.string_repr(text=y_boundaries[0])}\n")
-                writer.write(f".Ymax {VbaWriter.string_repr(text=y_boundaries[1])}\n")
+                y_min, y_max = y_boundaries
+                parts.append(_BOUNDARY_TMPL_Y.format(s(y_min), s(y_max)))
             if z_boundaries is not None:
-                writer.write(f".Zmin {VbaWriter.string_repr(text=z_boundaries[0])}\n")
-                writer.write(f".Zmin {VbaWriter.string_repr(text=z_boundaries[1])}\n")
+                z_min, z_max = z_boundaries
+                parts.append(_BOUNDARY_TMPL_Z.format(s(z_min), s(z_max)))
         else:
             if boundary_type is not None:
-                writer.write(f".Xmin {VbaWriter.string_repr(text=boundary_type)}\n")
-        writer.end_with()
+                parts.append(_BOUNDARY_TMPL_ALL.format(s(boundary_type)))
+        return VbaWriter.with_block("Boundary", "".join(parts))
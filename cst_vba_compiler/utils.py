@@ -7,6 +7,10 @@ date: 01-10-2024
 
 from .writer import VbaWriter
 
+# Quoted VBA booleans, for arguments that are known to be a `bool`.
+QUOTED_TRUE = '"True"'
+QUOTED_FALSE = '"False"'
+
 
 def wrap_nonstr_in_double_quotes(value) -> str:
     """Wrap any given `value` that implements `repr` in double quotes,
@@ -15,7 +19,9 @@ def wrap_nonstr_in_double_quotes(value) -> str:
     :param value: Value that implements the `__repr__` dunder method.
     :type value: Any that implements `__repr__`
     """
-    return value if isinstance(value, str) else VbaWriter.wrap_double_quotes(value)
+    # Same result as `VbaWriter.wrap_double_quotes`, inlined since this is called for nearly every value.
+    # A single `isinstance` check is cheaper than dispatching on the type with `functools.singledispatch`.
+    return value if isinstance(value, str) else f'"{value!r}"'
 
 
 def num_or_list_of_nums_to_str(nums: int | list[int]) -> str:
@@ -28,10 +34,5 @@ def num_or_list_of_nums_to_str(nums: int | list[int]) -> str:
     :type nums: int | list[int]
     """
     if isinstance(nums, int):
-        return wrap_nonstr_in_double_quotes(value=nums)
-    else:
-        string: str = ""
-        for num in nums:
-            string += repr(num)
-            string += ","
-        return VbaWriter.string_repr(text=string)
+        return f'"{nums}"'
+    return VbaWriter.string_repr(",".join(map(repr, nums)))
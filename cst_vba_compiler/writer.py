@@ -6,29 +6,76 @@ date: 01-10-2024
 """
 
 import os
+import unicodedata
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from io import TextIOWrapper
 
+# Boilerplate lines that always need to be at the top of the VBA script, namely:
+# - Option Explicit
+_HEADER = "Option Explicit\n"
+# VBA types that are inferred from the Python types, see `VbaWriter.add_parameter`.
+_PY_TO_VBA: dict[type, str] = {
+    bool: "Boolean",
+    float: "Double",
+    int: "Integer",
+    str: "String",
+}
+
 
 class VbaWriter(object):
-    """This is a class which handles all the IO for the generate VBA script.
+    """This is a class which handles all the IO for the generate VBA script. By default every
+    write is passed straight on to the file handle. With a non-zero `buffer_size` the generated
+    script is kept in memory, and only passed on to the file handle once `buffer_size`
+    characters have been collected, when `end_main` is called, or when the writer is flushed
+    or closed. A buffering writer must therefore be flushed or closed before the handle is
+    closed, it can also be used as a context manager, which closes it on exit. See `open` for
+    a buffering writer that owns its file handle.
 
     :param filehandle: Handle of the file we want to write to. This assumed to be
-        the return value of the `open` method.
+        the return value of the `open` method in text mode.
     :type filehandle: TextIOWrapper
+    :param buffer_size: Amount of characters to collect before writing to the file handle,
+        0 writes every line straight to the file handle.
+    :type buffer_size: int (default=0)
     """
 
-    def __init__(self, filehandle: TextIOWrapper):
+    # Fixed set of attributes, such that they are stored in slots instead of an instance dictionary.
+    # The private attributes are listed under their mangled names.
+    __slots__ = (
+        "_VbaWriter__filehandle",
+        "_VbaWriter__filepath",
+        "_VbaWriter__buffer",
+        "_VbaWriter__buffered_size",
+        "_VbaWriter__buffer_size",
+        "_VbaWriter__indent_depth",
+        "_VbaWriter__indent_prefix",
+        "_VbaWriter__batch_depth",
+        "_VbaWriter__parameters",
+        "_VbaWriter__current_scope",
+    )
+
+    def __init__(self, filehandle: TextIOWrapper, buffer_size: int = 0):
         """Constructor method"""
         # Handle to the VBA file to which we can write.
         self.__filehandle = filehandle
         # Extract file path from handle
         self.__filepath = self.__filehandle.name
-        # Store the current indent depth, e.g. the amount of tabs to prepend.
+        # Text that has not been passed on to the file handle yet, and its total length.
+        self.__buffer: list[str] = []
+        self.__buffered_size: int = 0
+        self.__buffer_size: int = buffer_size
+        # Store the current indent depth, e.g. the amount of tabs to prepend, and the tabs themselves
+        # such that they are only built when the depth changes.
         self.__indent_depth: int = 0
-        # Write boilerplate lines in the VBA script that always need to be there.
-        self.__write_essentials()
-        # Initialise an empty dictionary of parameters, the dictionary grows when we add parameters
-        self.__parameters: dict = dict()
+        self.__indent_prefix: str = ""
+        # Amount of nested `batch` contexts, the buffer is not flushed while this is non-zero.
+        self.__batch_depth: int = 0
+        # Write boilerplate lines in the VBA script that always need to be there, nothing is indented yet.
+        self._raw_write(_HEADER)
+        # Initialise a dictionary of parameters per scope, the dictionaries grow when we add parameters
+        self.__parameters: dict[str | None, dict[str, dict]] = {None: {}}
         # Store what the current scope is, i.e. are we currently in a Function? If so which one? Are
         # we in the Main entry point? etc.
         self.__current_scope: str | None = None
@@ -37,22 +84,135 @@ class VbaWriter(object):
         """API for writing with `text` to the private
         file handle of the class. This can also be used to
         write VBA script manually and insert it into the file
-        in case certain aspects are not supported.
+        in case certain aspects are not supported. Every line in `text`
+        is indented, so a block of several lines can be written at once.
 
         :param text: Text to write
         :type text: str
         """
+        prefix: str = self.__indent_prefix
+        if prefix:
+            # Text of a single line, the common case, only needs the prefix in front.
+            if "\n" not in text[:-1]:
+                text = prefix + text
+            else:
+                text = VbaWriter.__indent(text, prefix)
+        if self.__buffer_size or self.__batch_depth:
+            self._raw_write(text)
+            return
+        # Without a buffer the text is passed straight on to the file handle.
         try:
-            self.__filehandle.write("\t" * self.__indent_depth + text)
-        except:
-            raise IOError(f"Unable to write contents to {self.__filepath}.")
-
-    def __write_essentials(self) -> None:
-        """Write contents to the VBA script that will always need to be there,
-        namely:
-        - Option Explicit
+            self.__filehandle.write(text)
+        except OSError as error:
+            raise IOError(f"Unable to write contents to {self.__filepath}.") from error
+
+    def write_with(self, structure: str, text: str) -> None:
+        """Write `text` as the contents of a `With` block for `structure` with a single
+        write. This is equivalent to calling `start_with`, `write` and `end_with` in sequence.
+
+        :param structure: Name of the structure
+        :type structure: str
+        :param text: Contents of the `With` block
+        :type text: str
         """
-        self.write(text="Option Explicit\n")
+        prefix: str = self.__indent_prefix
+        # The contents are indented once, by the current indent and the tab of the block.
+        body: str = VbaWriter.__indent(text, prefix + "\t") if text else ""
+        self._raw_write(f"{prefix}With {structure}\n{body}{prefix}End With\n")
+
+    @staticmethod
+    def with_block(structure: str, text: str) -> str:
+        """Return the `With` block for `structure` with contents `text` without writing it. The
+        block is not indented, such that several blocks can be joined and passed to `write` at once.
+
+        :param structure: Name of the structure
+        :type structure: str
+        :param text: Contents of the `With` block
+        :type text: str
+        """
+        # Indenting an empty text would leave a lone tab in front of `End With`.
+        body: str = VbaWriter.__indent(text, "\t") if text else ""
+        return f"With {structure}\n{body}End With\n"
+
+    @staticmethod
+    def __indent(text: str, indent: str) -> str:
+        """Prepend `indent` to every line in `text`, a trailing newline does not start a new line.
+
+        :param text: Text to indent
+        :type text: str
+        :param indent: String to prepend to every line
+        :type indent: str
+        """
+        if text.endswith("\n"):
+            return indent + text[:-1].replace("\n", "\n" + indent) + "\n"
+        return indent + text.replace("\n", "\n" + indent)
+
+    def _raw_write(self, text: str) -> None:
+        """Pass `text` on as is, e.g. without indentation. Without a buffer it is written straight
+        to the file handle, otherwise it is appended to the buffer, which is flushed when it has grown
+        past the buffer size.
+
+        :param text: Text to write
+        :type text: str
+        """
+        if not self.__buffer_size and not self.__batch_depth:
+            # Without a buffer the text is passed straight on to the file handle.
+            try:
+                self.__filehandle.write(text)
+            except OSError as error:
+                raise IOError(
+                    f"Unable to write contents to {self.__filepath}."
+                ) from error
+            return
+        self.__buffer.append(text)
+        self.__buffered_size += len(text)
+        if self.__buffered_size >= self.__buffer_size and not self.__batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the contents of the buffer to the file handle with a single write, and
+        empty the buffer."""
+        if self.__buffer:
+            try:
+                self.__filehandle.write("".join(self.__buffer))
+            except OSError as error:
+                raise IOError(
+                    f"Unable to write contents to {self.__filepath}."
+                ) from error
+            self.__buffer.clear()
+            self.__buffered_size = 0
+
+    def close(self) -> None:
+        """Flush the buffer and close the file handle, the handle is also closed when the flush fails."""
+        try:
+            self.flush()
+        finally:
+            self.__filehandle.close()
+
+    def __enter__(self) -> "VbaWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Context manager that keeps everything written within the context in the buffer, even when it
+        grows past the buffer size, such that it is passed on to the file handle with a single write. A
+        nested `batch` is merged into the outer one.
+
+        Example:
+            with writer.batch():
+                for i in range(100):
+                    Curves.Line(writer, f"line{i}", (0.0, i), (1.0, i))
+        """
+        self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            self.__batch_depth -= 1
+            if not self.__batch_depth and self.__buffered_size >= self.__buffer_size:
+                self.flush()
 
     @staticmethod
     def create(filepath: str) -> None:
@@ -66,26 +226,56 @@ class VbaWriter(object):
         directory = os.path.dirname(filepath)
 
         # Create the directories if they do not exist
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-
-        # Create the file only if it does not exist
-        if not os.path.exists(filepath):
-            with open(filepath, "a"):
-                pass  # No need to write anything
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Opening in append mode creates the file if it does not exist, and leaves an existing file untouched
+        with open(filepath, "a"):
+            pass  # No need to write anything
+
+    @classmethod
+    def open(
+        cls, filepath: str, buffer_size: int = 65536, file_buffering: int = 1 << 20
+    ) -> "VbaWriter":
+        """Create the directories in between `filepath`, open the file at `filepath` and return a
+        writer for it. The file is opened for writing with a large buffer, such that the chunks
+        passed on by the writer reach the disk in few writes. Close the writer when the script is
+        done, or use it as a context manager.
+
+        :param filepath: Path to the VBA file we want to write.
+        :type filepath: str
+        :param buffer_size: Amount of characters the writer collects before writing to the file handle.
+        :type buffer_size: int (default=65536)
+        :param file_buffering: Buffer size in bytes of the file handle itself.
+        :type file_buffering: int (default=1 << 20)
+        """
+        # Only the directories are created up front, the file itself is created by opening it.
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return cls(open(filepath, "w", buffering=file_buffering), buffer_size)
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def string_repr(text: str) -> str:
-        """Given a string, return the representation of that
-        string where the single quotes are replaced with double quotes
-        as required by VBA.
+        """Given a string, return the VBA String literal of that
+        string, e.g. the string wrapped in double quotes where every double
+        quote inside the string is doubled, as required by VBA. The results are
+        cached, since the same names and options tend to be converted over and over again.
+        A VBA String literal cannot hold line breaks or other control characters, so a
+        `ValueError` is raised for those.
 
         :param text: Text to convert into a VBA String.
         :type text: str
         """
-        text_repr: str = repr(text)
-        text_repr = '"' + text_repr.strip("'") + '"'
-        return text_repr
+        # Only text that is not printable can hold control characters, so the common case skips the scan.
+        if not text.isprintable() and any(
+            unicodedata.category(char) == "Cc" for char in text
+        ):
+            raise ValueError(
+                f"The text {text!r} contains control characters, which cannot be part of a VBA String."
+            )
+        return '"' + text.replace('"', '""') + '"'
 
     @staticmethod
     def wrap_double_quotes(value) -> str:
@@ -100,18 +290,22 @@ class VbaWriter(object):
     def start_main(self) -> None:
         """Write the line 'Sub Main ()' which functions as the entry point for a VBA script. Update the
         current scope."""
-        self.write(text="Sub Main ()\n")
+        self.write("Sub Main ()\n")
         self.__current_scope = "Main"
+        self.__parameters.setdefault("Main", {})
         self.__indent_depth += 1
+        self.__indent_prefix = "\t" * self.__indent_depth
 
     def end_main(self) -> None:
         """Write the line 'End Sub' to close the VBA script entry point. Everything written between
         the call of `start_main` method and this method is contained within the main loop of the VBA script.
-        The scope is set back to `None`
+        The scope is set back to `None`. The script is complete at this point, so the buffer is flushed.
         """
         self.__indent_depth -= 1
-        self.write(text="End Sub\n")
+        self.__indent_prefix = "\t" * self.__indent_depth
+        self.write("End Sub\n")
         self.__current_scope = None
+        self.flush()
 
     def start_with(self, structure: str) -> None:
         """Start a `With` block for `structure`.
@@ -119,13 +313,53 @@ class VbaWriter(object):
         :param structure: Name of the structure
         :type structure: str
         """
-        self.write(text=f"With {structure}\n")
+        self.write(f"With {structure}\n")
         self.__indent_depth += 1
+        self.__indent_prefix = "\t" * self.__indent_depth
 
     def end_with(self) -> None:
         """End a `With` block"""
         self.__indent_depth -= 1
-        self.write(text="End With\n")
+        self.__indent_prefix = "\t" * self.__indent_depth
+        self.write("End With\n")
+
+    @contextmanager
+    def main(self) -> Iterator[None]:
+        """Context manager that wraps everything written within the context in the VBA script entry point,
+        equivalent to calling `start_main` before and `end_main` after. If an exception is raised within the
+        context, the entry point is not closed, but the scope and indentation are still restored.
+
+        Example:
+            with writer.main():
+                writer.add_parameter("width", 2.5)
+        """
+        depth, scope = self.__indent_depth, self.__current_scope
+        self.start_main()
+        try:
+            yield
+            self.end_main()
+        finally:
+            self.__indent_depth = depth
+            self.__indent_prefix = "\t" * depth
+            self.__current_scope = scope
+
+    @contextmanager
+    def with_structure(self, structure: str) -> Iterator[None]:
+        """Context manager that wraps everything written within the context in a `With` block for
+        `structure`, equivalent to calling `start_with` before and `end_with` after. If an exception is
+        raised within the context, the block is not closed, but the indentation is still restored.
+
+        :param structure: Name of the structure
+        :type structure: str
+        """
+        depth = self.__indent_depth
+        self.start_with(structure)
+        try:
+            yield
+            self.end_with()
+        finally:
+            self.__indent_depth = depth
+            self.__indent_prefix = "\t" * depth
 
     def list_parameters(self):
         """Method for printing the defined parameters."""
@@ -152,25 +386,18 @@ class VbaWriter(object):
         if isinstance(declare_type, str):
             vba_type: str = declare_type
         else:
-            match declare_type.__name__:
-                case "bool":
-                    vba_type: str = "Boolean"
-                case "float":
-                    vba_type: str = "Double"
-                case "int":
-                    vba_type: str = "Integer"
-                case "str":
-                    vba_type: str = "String"
-                case _:
-                    raise ValueError(
-                        f"The type {declare_type.__name__} does not have supported VBA type conversion."
-                    )
+            vba_type: str | None = _PY_TO_VBA.get(declare_type)
+            if vba_type is None:
+                raise ValueError(
+                    f"The type {declare_type.__name__} does not have supported VBA type conversion."
+                )
 
-        self.__parameters[(name, self.__current_scope)] = {
+        self.__parameters[self.__current_scope][name] = {
             "value": None,
             "type": vba_type,
         }
-        self.write(f"Dim {name} As {vba_type}\n")
+        # The line is a single line, so the indent prefix is prepended directly.
+        self._raw_write(f"{self.__indent_prefix}Dim {name} As {vba_type}\n")
 
     def assign_parameter(self, name: str, value) -> None:
         """Assign a value to a parameter whose type has already been defined.
@@ -187,12 +414,12 @@ class VbaWriter(object):
         :type value: Any
         """
         # Check if the parameter has been initialised
-        if (key := (name, self.__current_scope)) in self.__parameters:
-            self.__parameters[key]["value"] = value
-            val_vba_content: str = repr(value)
-            if isinstance(value, str):
-                val_vba_content = VbaWriter.string_repr(text=value)
-            self.write(f"{name} = {val_vba_content}\n")
+        if (parameter := self.__parameters[self.__current_scope].get(name)) is not None:
+            parameter["value"] = value
+            val_vba_content: str = (
+                VbaWriter.string_repr(value) if isinstance(value, str) else repr(value)
+            )
+            self._raw_write(f"{self.__indent_prefix}{name} = {val_vba_content}\n")
         else:
             raise ValueError(
                 f"Parameter {name} in scope {self.__current_scope} did not receive type initialisation."
@@ -235,39 +462,40 @@ class VbaWriter(object):
         """
         # Check if we need to infer the type
         if declare_type is None:
-            match value:
-                case bool():
-                    val_type: str = "Boolean"
-                case float():
-                    val_type: str = "Double"
-                case int():
-                    # Check if the value does not exceed 16-bit range
-                    if value >= -(2**15) and value <= 2**15 - 1:
-                        val_type: str = "Integer"
-                    else:
-                        raise ValueError(
-                            f"Size of value: {value} cannot be represented by a 16-bit integer, as required by VBA."
-                        )
-                case str():
-                    val_type: str = "String"
-                case _:
+            val_type: str | None = _PY_TO_VBA.get(type(value))
+            if val_type is None:
+                # Subclasses of the supported types, e.g. `numpy.float64`, use the type of their base.
+                for py_type, vba_type in _PY_TO_VBA.items():
+                    if isinstance(value, py_type):
+                        val_type = vba_type
+                        break
+                else:
                     raise ValueError(
                         f"Type of the `value` parameter: {type(value)}, is not supported for VBA type conversion."
                     )
+            # Check if the value does not exceed 16-bit range
+            if val_type == "Integer" and not -32768 <= value <= 32767:
+                raise ValueError(
+                    f"Size of value: {value} cannot be represented by a 16-bit integer, as required by VBA."
+                )
+            # The inferred type already tells whether the value is a string.
+            val_vba_content: str = (
+                VbaWriter.string_repr(value) if val_type == "String" else repr(value)
+            )
         else:
             val_type: str = declare_type
             # Note that this does not work for all types, see Boolean and String for example.
+            val_vba_content: str = (
+                VbaWriter.string_repr(value) if isinstance(value, str) else repr(value)
+            )
 
         # Add entry to the parameter list.
-        self.__parameters[(name, self.__current_scope)] = {
+        self.__parameters[self.__current_scope][name] = {
             "value": value,
             "type": val_type,
         }
 
-        val_vba_content: str = repr(value)
-        if isinstance(value, str):
-            val_vba_content = VbaWriter.string_repr(text=value)
-
-        # Write line to the VBA scripts
-        self.write(text=f"Dim {name} As {val_type}\n")
-        self.write(text=f"{name} = {val_vba_content}\n")
+        # Write the declaration and assignment lines to the VBA script at once. Both are single
+        # lines, so the indent prefix is prepended directly instead of indenting the text afterwards.
+        p: str = self.__indent_prefix
+        self._raw_write(f"{p}Dim {name} As {val_type}\n{p}{name} = {val_vba_content}\n")
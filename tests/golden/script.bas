@@ -0,0 +1,423 @@
+Option Explicit
+Dim a As Double
+a = 1.5
+Sub Main ()
+	Dim b As Integer
+	b = 3
+	Dim s As String
+	s = "hello"
+	Dim c As Double
+	c = 2.0
+	Dim t As String
+	t = "x"
+	With Units
+		.Geometry "mm"
+		.Time "ns"
+		.Frequency "GHz"
+		.TemperatureUnit "celsius"
+	End With
+	With Line
+		.Reset
+		.Name "bl"
+		.Curve "curve"
+		.X1 "0"
+		.Y1 "0"
+		.X2 "1"
+		.Y2 "1"
+		.Create
+	End With
+	With Units
+		.Geometry "cm"
+		.Time "s"
+		.Frequency "Hz"
+		.TemperatureUnit "kelvin"
+	End With
+	With ASCIIExport
+		.Reset
+		.FileName "out.txt"
+		.SetfileType "ascii"
+		.UseSubvolume "False"
+		.ExportCoordinatesInMeter "False"
+		.Execute
+	End With
+	With ASCIIExport
+		.Reset
+		.FileName "out.csv"
+		.SetfileType "csv"
+		.Mode "FixedNumber"
+		.Step "3"
+		.StepX "1"
+		.StepY "2"
+		.StepZ "3"
+		.SetSubvolume "0.0", "1.0", p, "2.0", "3.0", "4.0"
+		.UseSubvolume "True"
+		.ExportCoordinatesInMeter "True"
+		.SetCsvSeparator ";"
+		.Execute
+	End With
+	With Ellipse
+		.Reset
+		.Name "e1"
+		.Curve "curve"
+		.XRadius "1.0"
+		.YRadius ry
+		.Xcenter "0.0"
+		.Ycenter cy
+		.Segments "0"
+		.Create
+	End With
+	With Ellipse
+		.Reset
+		.Name "e2"
+		.Curve "c2"
+		.XRadius "3"
+		.YRadius "4"
+		.Xcenter "1"
+		.Ycenter "2"
+		.Segments "5"
+		.Create
+	End With
+	With Line
+		.Reset
+		.Name "l1"
+		.Curve "curve"
+		.X1 "0.0"
+		.Y1 "1.0"
+		.X2 x
+		.Y2 "2.0"
+		.Create
+	End With
+	With Polygon
+		.Reset
+		.Name "p1"
+		.Curve "curve"
+		.Point "0", "0"
+		.LineTo "1", "0"
+		.LineTo "1", h
+		.LineTo "0", "1"
+		.Create
+	End With
+	With Polygon
+		.Reset
+		.Name "p2"
+		.Curve "c3"
+		.Point "0", "0"
+		.RLine "1", "0"
+		.LineTo "1", "1"
+		.Create
+	End With
+	With Polygon
+		.Reset
+		.Name "pa"
+		.Curve "c"
+		.Point "0", "0"
+		.LineTo "1", "1"
+		.Create
+		.Reset
+		.Name "pb"
+		.Curve "c"
+		.Point "0", "0"
+		.RLine "1", "1"
+		.LineTo "2", "2"
+		.Create
+	End With
+	With Line
+		.Reset
+		.Name "l2"
+		.Curve "c"
+		.X1 "0"
+		.Y1 "0"
+		.X2 "1"
+		.Y2 y
+		.Create
+		.Reset
+		.Name "l3"
+		.Curve "c"
+		.X1 "1"
+		.Y1 "1"
+		.X2 "2"
+		.Y2 "2"
+		.Create
+	End With
+	With Line
+		.Reset
+		.Name "l4"
+		.Curve "c{x}"
+		.X1 "0"
+		.Y1 "0"
+		.X2 "1"
+		.Y2 y
+		.Create
+	End With
+	With Line
+		.Reset
+		.Name "l5"
+		.Curve "c{x}"
+		.X1 "2"
+		.Y1 "2"
+		.X2 "3"
+		.Y2 "3"
+		.Create
+	End With
+	With TrimCurves
+		.Reset
+		.Curve "curve"
+		.CurveItem1 "a"
+		.CurveItem2 "b"
+		.DeleteEdges1 "1"
+		.DeleteEdges2 "2,3"
+		.Trim
+	End With
+	With TrimCurves
+		.Reset
+		.Curve "curve"
+		.CurveItem1 "a"
+		.CurveItem2 "b"
+		.DeleteEdges1 ""
+		.DeleteEdges2 ""
+		.Trim
+	End With
+	Curve.NewCurve "c"
+	Curve.NewCurve "c", "n"
+	Curve.DeleteCurve "c"
+	Curve.DeleteCurveItem "c", "n"
+	Component.New "comp"
+	Component.Delete "comp"
+	Component.Rename "a", "b"
+	With Face
+		.Reset
+		.Name "f1"
+		.Type "ExtrudeCurve"
+		.Curve "c"
+		.Taperangle "3.0"
+		.Thickness "2.0"
+		.Twistangle "1.0"
+		.Create
+	End With
+	With Face
+		.Reset
+		.Name "f2"
+		.Type "CoverCurve"
+		.Curve "c"
+		.Create
+	End With
+	With Face
+		.Reset
+		.Name "f3"
+		.Type "PickFace"
+		.Create
+	End With
+	With Face
+		.Reset
+		.Name "f4"
+		.Type "CoverCurve"
+		.Curve "c"
+		.Create
+		.Reset
+		.Name "f5"
+		.Type "ExtrudeCurve"
+		.Curve "c"
+		.Taperangle "3.0"
+		.Thickness "2.0"
+		.Twistangle "1.0"
+		.Create
+	End With
+	Face.Delete "f1"
+	With Rotate
+		.Name "r"
+		.Component "comp"
+		.NumberOfPickedFaces "1"
+		.Material "PEC"
+		.Mode "Picks"
+		.Angle "360.0"
+		.Height "0.0"
+		.RadiusRatio "1.0"
+		.NSteps "0"
+		.SplitClosedEdges "True"
+		.SegmentedProfile "False"
+		.DeleteBaseFaceSolid "False"
+		.ClearPickedFace "True"
+		.SimplifySolid "True"
+		.UseAdvancedSegmentedRotation "True"
+		.CutEndOff "False"
+		.Create
+	End With
+	With Rotate
+		.Name "r"
+		.Component "comp"
+		.NumberOfPickedFaces "1"
+		.Material "PEC"
+		.Mode "Pointlist"
+		.StartAngle "10.0"
+		.Angle "90.0"
+		.Height "0.0"
+		.RadiusRatio "1.0"
+		.NSteps "3"
+		.SplitClosedEdges "True"
+		.SegmentedProfile "False"
+		.DeleteBaseFaceSolid "False"
+		.ClearPickedFace "True"
+		.SimplifySolid "True"
+		.UseAdvancedSegmentedRotation "True"
+		.CutEndOff "False"
+		.Create
+	End With
+	With Cylinder
+		.Reset
+		.Name "cyl"
+		.Component "comp"
+		.Material "PEC"
+		.Axis "x"
+		.Outerradius "2.0"
+		.Innerradius "0.0"
+		.Xcenter "0.0"
+		.Ycenter "0.0"
+		.Zcenter "0.0"
+		.Xrange "0", "1"
+		.Segments "0"
+		.Create
+	End With
+	With Cylinder
+		.Reset
+		.Name "cyl"
+		.Component "comp"
+		.Material "PEC"
+		.Axis "y"
+		.Outerradius "2.0"
+		.Innerradius "1.0"
+		.Xcenter "1"
+		.Ycenter "2"
+		.Zcenter "3"
+		.Yrange "0", "1"
+		.Segments "4"
+		.Create
+	End With
+	With Cylinder
+		.Reset
+		.Name "cyl"
+		.Component "comp"
+		.Material "PEC"
+		.Axis "z"
+		.Outerradius R
+		.Innerradius "0.0"
+		.Xcenter "0.0"
+		.Ycenter "0.0"
+		.Zcenter "0.0"
+		.Zrange "0", L
+		.Segments "0"
+		.Create
+	End With
+	Pick.PickFaceFromId "comp:r", "3"
+	Pick.PickEdgeFromId "comp:r", "3", "4"
+	Pick.PickFaceFromId "c:a", "1"
+	Pick.PickFaceFromId "c:b", "2"
+	Pick.PickEdgeFromId "c:a", "1", "2"
+	Solid.Add "a", "b"
+	Solid.Add "say ""a""", "b"
+	Solid.Add "c:a", "c:b"
+	Solid.Add "c:a", "c:d"
+	With Transform
+		.Reset
+		.Name "s"
+		.Origin "Free"
+		.Center "0", "0", "0"
+		.PlaneNormal "0", "0", "1"
+		.MultipleObjects "True"
+		.GroupObjects "True"
+		.Transform "Shape", "Mirror"
+		.Repetitions "1"
+	End With
+	With Transform
+		.Reset
+		.Name "s"
+		.Origin "ShapeCenter"
+		.Vector "1", "2", z
+		.UsePickedPoints "False"
+		.InvertPickedPoints "False"
+		.MultipleObjects "False"
+		.GroupObjects "False"
+		.Transform "Shape", "Translate"
+		.Repetitions "2"
+	End With
+	With Transform
+		.Reset
+		.Vector "1", "0", h
+		.UsePickedPoints "False"
+		.MultipleObjects "True"
+		.GroupObjects "False"
+		.Repetitions "1"
+		.Name "a"
+		.Transform "Shape", "Translate"
+		.Name "b"
+		.Transform "Shape", "Translate"
+	End With
+	FileNew
+	OpenFile "C:\projects\a.cst"
+	Save
+	SaveAs "b.cst", "True"
+	Quit
+	SetLock "True"
+	SelectTreeItem "2D/3D Results\E-field\e"
+	With EigenmodeSolver
+		.Reset
+		.SetMeshType "Hexahedral Mesh"
+		.SetMeshAdaptationHex "True"
+		.SetNumberOfModes "5"
+		.Start
+	End With
+	With EigenmodeSolver
+		.Reset
+		.SetMeshType "Tetrahedral Mesh"
+		.SetMeshAdaptationTet "False"
+		.SetNumberOfModes "5"
+		.Start
+	End With
+	Solver.FrequencyRange "1.0", "2.0"
+	With Background
+		.Reset
+		.Type "normal"
+		.Epsilon "1.0"
+		.Mu "1.0"
+		.ElConductivity "0.0"
+		.XminSpace "0"
+		.XmaxSpace "1"
+		.YminSpace "0"
+		.YmaxSpace "1"
+		.ZminSpace "0"
+		.ZmaxSpace "1"
+		.ThermalType "ptc"
+		.ThermalConductivity "0.5"
+		.ApplyInAllDirections "False"
+	End With
+	With Background
+		.Reset
+		.Type "pec"
+		.ApplyInAllDirections "True"
+	End With
+	With Boundary
+		.ApplyInAllDirections "False"
+		.Xmin "electric"
+		.Xmax "magnetic"
+		.Ymin "open"
+		.Ymax "open"
+		.Zmin "periodic"
+		.Zmax "open"
+	End With
+	With Boundary
+		.ApplyInAllDirections "True"
+		.Xmin "electric"
+	End With
+	With Outer
+		With Line
+			.Reset
+			.Name "nested"
+			.Curve "curve"
+			.X1 "0"
+			.Y1 "0"
+			.X2 "1"
+			.Y2 "1"
+			.Create
+		End With
+		manual
+	End With
+End Sub
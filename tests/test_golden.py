@@ -0,0 +1,319 @@
+""" Golden-file tests for the generated VBA script.
+
+`test_script_matches_golden` compares the output of a script that calls every emitter with
+`golden/script.bas`. When the output changes on purpose, regenerate the file with
+
+    python -c "from tests.test_golden import write_golden; write_golden()"
+
+and review the diff before committing it.
+"""
+
+import os
+
+import pytest
+
+from cst_vba_compiler.export.ascii import ASCIIExport
+from cst_vba_compiler.globals.units import Units
+from cst_vba_compiler.modeling.curves import Curves, PolygonSpec
+from cst_vba_compiler.modeling.picks import Picks
+from cst_vba_compiler.modeling.shapes import (
+    Component,
+    Faces,
+    FaceSpec,
+    FromProfile2D,
+    Shapes,
+)
+from cst_vba_compiler.modeling.solids import Solids
+from cst_vba_compiler.modeling.tools import Transform
+from cst_vba_compiler.project.file import FileHandling
+from cst_vba_compiler.project.general import General
+from cst_vba_compiler.project.tree import SelectTreeItem
+from cst_vba_compiler.solver.eigenmode import EigenmodeSolver, EigenmodeSolverText
+from cst_vba_compiler.solver.general import SolverSettings
+from cst_vba_compiler.solver.settings import Settings
+from cst_vba_compiler.writer import VbaWriter
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden", "script.bas")
+
+
+def write_script(writer: VbaWriter) -> None:
+    """Write a script that calls every emitter, with and without the optional arguments."""
+    writer.add_parameter("a", 1.5)
+    writer.start_main()
+    writer.add_parameter("b", 3)
+    writer.add_parameter("s", "hello")
+    writer.initialise_parameter("c", float)
+    writer.assign_parameter("c", 2.0)
+    writer.initialise_parameter("t", "String")
+    writer.assign_parameter("t", "x")
+    with writer.batch():
+        Units(writer)
+        Curves.Line(writer, "bl", (0, 0), (1, 1))
+    Units(writer, "cm", "s", "Hz", "kelvin")
+    ASCIIExport(writer, "out.txt")
+    ASCIIExport(
+        writer,
+        "out.csv",
+        data_mode="FixedNumber",
+        file_type="csv",
+        step=3,
+        step_directional=[1, 2, 3],
+        subvolume=[(0.0, 1.0), ("p", 2.0), (3.0, 4.0)],
+        use_subvolume=True,
+        use_meter=True,
+        csv_separator=";",
+    )
+    Curves.Ellipse(writer, "e1", (0.0, "cy"), 1.0, "ry")
+    Curves.Ellipse(writer, "e2", (1, 2), 3, 4, segments=5, curve="c2")
+    Curves.Line(writer, "l1", (0.0, 1.0), ("x", 2.0))
+    Curves.Polygon(writer, "p1", (0, 0), [(1, 0), (1, "h"), (0, 1)])
+    Curves.Polygon(
+        writer, "p2", (0, 0), [(1, 0), (1, 1)], which_relative=[True, False], curve="c3"
+    )
+    Curves.Polygons(
+        writer,
+        [
+            PolygonSpec("pa", (0, 0), [(1, 1)]),
+            PolygonSpec("pb", (0, 0), [(1, 1), (2, 2)], [True, False]),
+        ],
+        curve="c",
+    )
+    Curves.LineBatch(
+        writer, [("l2", (0, 0), (1, "y")), ("l3", (1, 1), (2, 2))], curve="c"
+    )
+    emit = Curves.line_emitter(writer, curve="c{x}")
+    emit("l4", (0, 0), (1, "y"))
+    emit("l5", (2, 2), (3, 3))
+    Curves.TrimCurves(writer, "a", "b", 1, [2, 3])
+    Curves.TrimCurves(writer, "a", "b", None, None)
+    Curves.NewCurve(writer, "c")
+    Curves.NewCurve(writer, "c", "n")
+    Curves.DeleteCurve(writer, "c")
+    Curves.DeleteCurveItem(writer, "n", "c")
+    Component.New(writer, "comp")
+    Component.Delete(writer, "comp")
+    Component.Rename(writer, "a", "b")
+    Faces.Face(
+        writer,
+        "f1",
+        "ExtrudeCurve",
+        curve="c",
+        twistangle=1.0,
+        thickness=2.0,
+        taperangle=3.0,
+        offset=4.0,
+    )
+    Faces.Face(writer, "f2", "CoverCurve", curve="c")
+    Faces.Face(writer, "f3", "PickFace")
+    Faces.FaceBatch(
+        writer,
+        [
+            FaceSpec("f4", "CoverCurve", "c"),
+            FaceSpec("f5", "ExtrudeCurve", "c", 1.0, 2.0, 3.0),
+        ],
+    )
+    Faces.DeleteFace(writer, "f1")
+    FromProfile2D.Rotate(writer, "r", "comp", "PEC", "Picks")
+    FromProfile2D.Rotate(
+        writer,
+        "r",
+        "comp",
+        "PEC",
+        "Pointlist",
+        angle=90.0,
+        start_angle=10.0,
+        Nsteps=3,
+    )
+    Shapes.Cylinder(writer, "cyl", "comp", "PEC", "x", (0, 1), 2.0)
+    Shapes.Cylinder(writer, "cyl", "comp", "PEC", "y", (0, 1), 2.0, 1.0, (1, 2, 3), 4)
+    Shapes.Cylinder(writer, "cyl", "comp", "PEC", "z", (0, "L"), "R")
+    Picks.PickFaceFromId(writer, "comp:r", 3)
+    Picks.PickEdgeFromId(writer, "comp:r", 3, 4)
+    Picks.PickFaceFromIdBatch(writer, [("c:a", 1), ("c:b", 2)])
+    Picks.PickEdgeFromIdBatch(writer, [("c:a", 1, 2)])
+    Solids.Add(writer, "a", "b")
+    Solids.Add(writer, 'say "a"', "b")
+    Solids.AddChain(writer, "c:a", ["c:b", "c:d"])
+    Transform.Transform(
+        writer,
+        "s",
+        "Shape",
+        "Mirror",
+        plane_normal=(0, 0, 1),
+        origin="Free",
+        center=(0, 0, 0),
+        copy=True,
+        unite=True,
+    )
+    Transform.Transform(
+        writer,
+        "s",
+        "Shape",
+        "Translate",
+        vector=(1, 2, "z"),
+        use_picked_points=False,
+        invert_picked_points=False,
+        repetitions=2,
+    )
+    Transform.TranslateBatch(writer, ["a", "b"], (1, 0, "h"), copy=True)
+    FileHandling.FileNew(writer)
+    FileHandling.OpenFile(writer, "C:\\projects\\a.cst")
+    FileHandling.Save(writer)
+    FileHandling.SaveAs(writer, "b.cst", True)
+    FileHandling.Quit(writer)
+    General.DisableInteraction(writer, True)
+    SelectTreeItem(writer, "2D/3D Results\\E-field\\e")
+    EigenmodeSolver(writer, 5, "Hexahedral Mesh", auto_hex_mesh=True)
+    EigenmodeSolver(writer, 5, "Tetrahedral Mesh")
+    SolverSettings.FrequencyRange(writer, (1.0, 2.0))
+    Settings.Background(
+        writer, "normal", False, 1.0, 1.0, 0.0, (0, 1), (0, 1), (0, 1), "ptc", 0.5
+    )
+    Settings.Background(writer, "pec", True)
+    Settings.Boundaries(
+        writer, False, ("electric", "magnetic"), ("open", "open"), ("periodic", "open")
+    )
+    Settings.Boundaries(writer, True, boundary_type="electric")
+    with writer.with_structure("Outer"):
+        Curves.Line(writer, "nested", (0, 0), (1, 1))
+        writer.write("manual\n")
+    writer.end_main()
+
+
+def generate(filepath: str) -> str:
+    """Write the script of `write_script` to `filepath` and return its contents."""
+    with VbaWriter.open(filepath) as writer:
+        write_script(writer)
+    with open(filepath) as f:
+        return f.read()
+
+
+def write_golden() -> None:
+    """Regenerate the golden file from the current emitters."""
+    generate(GOLDEN_PATH)
+
+
+def test_script_matches_golden(tmp_path):
+    with open(GOLDEN_PATH) as f:
+        expected = f.read()
+    assert generate(str(tmp_path / "script.bas")) == expected
+
+
+@pytest.mark.parametrize("buffer_size", [0, 1, 64, 65536])
+def test_buffer_size_does_not_change_output(tmp_path, buffer_size):
+    filepath = str(tmp_path / "script.bas")
+    with open(filepath, "w") as f:
+        writer = VbaWriter(f, buffer_size)
+        write_script(writer)
+        writer.flush()
+    with open(filepath) as f, open(GOLDEN_PATH) as golden:
+        assert f.read() == golden.read()
+
+
+def test_output_after_end_main_reaches_caller_handle(tmp_path):
+    filepath = str(tmp_path / "script.bas")
+    with open(filepath, "w") as f:
+        writer = VbaWriter(f)
+        writer.start_main()
+        writer.end_main()
+        writer.write("Function F()\n")
+    with open(filepath) as f:
+        assert f.read() == "Option Explicit\nSub Main ()\nEnd Sub\nFunction F()\n"
+
+
+def collect(tmp_path, emit) -> str:
+    """Return the lines written by `emit` after the header of the script."""
+    filepath = str(tmp_path / "script.bas")
+    with VbaWriter.open(filepath) as writer:
+        emit(writer)
+    with open(filepath) as f:
+        return f.read().removeprefix("Option Explicit\n")
+
+
+def test_pick_face_needs_no_curve(tmp_path):
+    text = collect(tmp_path, lambda w: Faces.Face(w, "f", "PickFace"))
+    assert '.Type "PickFace"' in text
+    assert ".Curve" not in text
+
+
+@pytest.mark.skipif(not __debug__, reason="The validation asserts are stripped by -O.")
+def test_curve_modes_need_a_curve(tmp_path):
+    with pytest.raises(AssertionError):
+        collect(tmp_path, lambda w: Faces.Face(w, "f", "CoverCurve"))
+
+
+def test_background_accepts_ptc(tmp_path):
+    text = collect(
+        tmp_path, lambda w: Settings.Background(w, "normal", True, thermal_type="ptc")
+    )
+    assert '\t.ThermalType "ptc"\n' in text
+
+
+def test_boundaries_write_upper_z_bound(tmp_path):
+    text = collect(
+        tmp_path,
+        lambda w: Settings.Boundaries(w, False, z_boundaries=("electric", "open")),
+    )
+    assert '\t.Zmin "electric"\n\t.Zmax "open"\n' in text
+
+
+def test_text_variants_match_the_writing_emitters(tmp_path):
+    def separate(writer):
+        Transform.Transform(writer, "a", "Shape", "Translate", vector=(1, 0, 0))
+        Settings.Background(writer, "normal", True)
+        EigenmodeSolver(writer, 5, "Tetrahedral Mesh")
+
+    def joined(writer):
+        writer.write(
+            Transform.TransformText("a", "Shape", "Translate", vector=(1, 0, 0))
+            + Settings.BackgroundText("normal", True)
+            + EigenmodeSolverText(5, "Tetrahedral Mesh")
+        )
+
+    assert collect(tmp_path, joined) == collect(tmp_path, separate)
+
+
+def test_string_repr_doubles_double_quotes():
+    assert VbaWriter.string_repr('say "hi"') == '"say ""hi"""'
+    assert VbaWriter.string_repr("it's") == '"it\'s"'
+    assert VbaWriter.string_repr("C:\\dir\\file") == '"C:\\dir\\file"'
+
+
+@pytest.mark.parametrize("text", ["two\nlines", "tab\there", "bell\x07"])
+def test_string_repr_rejects_control_characters(text):
+    with pytest.raises(ValueError):
+        VbaWriter.string_repr(text)
+
+
+def test_empty_batches_write_nothing(tmp_path):
+    def emit(writer):
+        writer.start_main()
+        Curves.Polygons(writer, [])
+        Curves.LineBatch(writer, [])
+        Faces.FaceBatch(writer, [])
+        Transform.TranslateBatch(writer, [], (1, 0, 0))
+        Picks.PickFaceFromIdBatch(writer, [])
+        Picks.PickEdgeFromIdBatch(writer, [])
+        Solids.AddChain(writer, "a", [])
+        writer.end_main()
+
+    assert collect(tmp_path, emit) == "Sub Main ()\nEnd Sub\n"
+
+
+def test_main_restores_state_when_body_raises(tmp_path):
+    def emit(writer):
+        with pytest.raises(RuntimeError):
+            with writer.main():
+                with writer.with_structure("Brick"):
+                    raise RuntimeError
+        writer.add_parameter("a", 1)
+
+    assert (
+        collect(tmp_path, emit)
+        == "Sub Main ()\n\tWith Brick\nDim a As Integer\na = 1\n"
+    )
+
+
+def test_solid_names_reject_control_characters(tmp_path):
+    with pytest.raises(ValueError):
+        collect(tmp_path, lambda w: Solids.Add(w, "a\nb", "c"))